@@ -42,13 +42,19 @@ def main():
     # Create and run the knowledge agent
     knowledge_agent = KnowledgeAgent(query=args.name, config=config, rounds=args.rounds)
 
-    # Aggregate knowledge through search and deep dives
-    knowledge = knowledge_agent.aggregate_knowledge()
+    # Prepare the output file up front so gathered intelligence streams to
+    # disk and stdout as each chunk arrives, instead of buffering the full
+    # report string (multi-MB for deep runs) before anything prints.
+    import os
+    import sys
+    from datetime import datetime
+
+    output_dir = "results"
+    os.makedirs(output_dir, exist_ok=True)
 
-    # Answer the final question
-    answer = knowledge_agent.answer_final_question(args.ask)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    filename = f"{output_dir}/{args.name.replace(' ', '_')}_{timestamp}.txt"
 
-    # Display results
     print("\n" + "="*80)
     print(f"OSINT Report for: {args.name}")
     print("="*80)
@@ -56,23 +62,6 @@ def main():
     print("\n" + "-"*80)
     print("GATHERED INTELLIGENCE:")
     print("-"*80)
-    print(knowledge)
-
-    print("\n" + "="*80)
-    print("FINAL ANSWER:")
-    print("="*80)
-    print(answer)
-    print("="*80 + "\n")
-
-    # Save results to file
-    import os
-    from datetime import datetime
-
-    output_dir = "results"
-    os.makedirs(output_dir, exist_ok=True)
-
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"{output_dir}/{args.name.replace(' ', '_')}_{timestamp}.txt"
 
     with open(filename, 'w', encoding='utf-8') as f:
         f.write(f"OSINT Report for: {args.name}\n")
@@ -81,7 +70,23 @@ def main():
         f.write("="*80 + "\n\n")
         f.write("GATHERED INTELLIGENCE:\n")
         f.write("-"*80 + "\n")
-        f.write(knowledge + "\n\n")
+
+        # Stream knowledge chunks as the agent produces them
+        for chunk in knowledge_agent.aggregate_knowledge_iter():
+            sys.stdout.write(chunk)
+            f.write(chunk)
+        sys.stdout.flush()
+        f.write("\n\n")
+
+        # Answer the final question
+        answer = knowledge_agent.answer_final_question(args.ask)
+
+        print("\n" + "="*80)
+        print("FINAL ANSWER:")
+        print("="*80)
+        print(answer)
+        print("="*80 + "\n")
+
         f.write("="*80 + "\n")
         f.write("FINAL ANSWER:\n")
         f.write("="*80 + "\n")
@@ -6,8 +6,11 @@ Deterministic Plan → Execute → Review → Adjust (PERA) cycles
 
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
+import hashlib
 import json
+import os
 
 from src.config import load_config
 from src.llm.llm_client import LLMClient
@@ -34,7 +37,7 @@ class ToolType(Enum):
     ADDRESS_LOOKUP = "address_lookup"
 
 
-@dataclass
+@dataclass(slots=True)
 class InvestigationPlan:
     """Structured investigation plan from Plan phase"""
     objective: str
@@ -44,7 +47,7 @@ class InvestigationPlan:
     estimated_depth: int = 1
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionResult:
     """Result from Execute phase"""
     tool: ToolType
@@ -55,7 +58,7 @@ class ExecutionResult:
     confidence: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class ReviewAssessment:
     """Assessment from Review phase"""
     objective_met: bool
@@ -64,7 +67,7 @@ class ReviewAssessment:
     recommendations: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class AdjustmentStrategy:
     """Strategy from Adjust phase"""
     continue_investigation: bool
@@ -73,6 +76,21 @@ class AdjustmentStrategy:
     max_cycles_reached: bool = False
 
 
+# Deterministic planning table built once at import: context field ->
+# (query template, tool). Plan construction walks this instead of a chain
+# of per-field branches and enum value round-trips.
+_CONTEXT_FIELD_TOOLS = (
+    ("name", "Verify identity of {}", ToolType.WEB_SEARCH),
+    ("username", "Search username: {}", ToolType.SOCIAL_LOOKUP),
+    ("email", "Check breach data for: {}", ToolType.BREACH_CHECK),
+)
+
+# Read once at import, like the other module constants; the per-instance
+# presence check stays in __init__ since the key is only required when
+# OpenRouter is actually in use.
+OPEN_ROUTER_API_KEY = os.getenv("OPEN_ROUTER_API_KEY")
+
+
 class GuardrAgent:
     """
     Autonomous OSINT agent using deterministic PERA cycles
@@ -83,18 +101,18 @@ class GuardrAgent:
     Adjust: Refine strategy based on gaps
     """
 
-    def __init__(self, config: Dict[str, Any], max_cycles: int = 3, use_openrouter: bool = True):
+    def __init__(self, config: Dict[str, Any], max_cycles: int = 3, use_openrouter: bool = True,
+                 concurrency: int = 5):
         self.config = config
         self.use_openrouter = use_openrouter
+        self.concurrency = max(1, concurrency)
 
         if use_openrouter:
             from src.llm.openrouter_client import OpenRouterClient
-            import os
-            openrouter_key = os.getenv("OPEN_ROUTER_API_KEY")
-            if not openrouter_key:
+            if not OPEN_ROUTER_API_KEY:
                 raise ValueError("OPEN_ROUTER_API_KEY not set in environment")
             self.openrouter = OpenRouterClient(
-                api_key=openrouter_key,
+                api_key=OPEN_ROUTER_API_KEY,
                 default_model="openai/o3-mini"
             )
             logger.info("Using OpenRouter with o3-mini for high-reasoning planning")
@@ -104,6 +122,23 @@ class GuardrAgent:
         self.max_cycles = max_cycles
         self.cycle_count = 0
         self.execution_history: List[Dict[str, Any]] = []
+        # Exact-match plan cache: planning only depends on the objective and
+        # the identity fields, so repeated cycles (or repeated investigations
+        # of the same subject) skip the planning call entirely.
+        self._plan_cache: Dict[str, InvestigationPlan] = {}
+
+    @staticmethod
+    def _plan_cache_key(objective: str, context: Dict[str, Any]) -> str:
+        fingerprint = json.dumps(
+            {
+                "objective": objective,
+                "name": context.get("name"),
+                "username": context.get("username"),
+                "email": context.get("email"),
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()
 
     def investigate(self, objective: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
@@ -120,6 +155,7 @@ class GuardrAgent:
 
         context = context or {}
         findings = []
+        previous_queries: List[str] = []
 
         while self.cycle_count < self.max_cycles:
             self.cycle_count += 1
@@ -159,9 +195,12 @@ class GuardrAgent:
                 logger.info("Max cycles reached")
                 break
 
-            # Update context for next cycle
+            # Update context for next cycle; extend the running query list
+            # with this cycle's results instead of rebuilding it from all
+            # findings every cycle.
+            previous_queries.extend(r.query for r in results)
             context.update({
-                "previous_findings": [f.query for f in findings],
+                "previous_findings": previous_queries,
                 "gaps": assessment.gaps_identified
             })
 
@@ -174,21 +213,21 @@ class GuardrAgent:
         """
         logger.info("Phase 1: PLAN")
 
-                # Simplified deterministic planning - decompose by context fields
+        cache_key = self._plan_cache_key(objective, context)
+        cached_plan = self._plan_cache.get(cache_key)
+        if cached_plan is not None:
+            logger.info("Plan cache hit, reusing existing plan")
+            return cached_plan
+
+        # Simplified deterministic planning - decompose by context fields
         sub_queries = []
         tools_required = []
 
-        if context.get("name"):
-            sub_queries.append(f"Verify identity of {context['name']}")
-            tools_required.append(ToolType.WEB_SEARCH)
-
-        if context.get("username"):
-            sub_queries.append(f"Search username: {context['username']}")
-            tools_required.append(ToolType.SOCIAL_LOOKUP)
-
-        if context.get("email"):
-            sub_queries.append(f"Check breach data for: {context['email']}")
-            tools_required.append(ToolType.BREACH_CHECK)
+        for field_name, query_template, tool in _CONTEXT_FIELD_TOOLS:
+            value = context.get(field_name)
+            if value:
+                sub_queries.append(query_template.format(value))
+                tools_required.append(tool)
 
         # If no context, use objective directly
         if not sub_queries:
@@ -196,21 +235,16 @@ class GuardrAgent:
             tools_required = [ToolType.WEB_SEARCH]
 
         try:
-            plan_data = {
-                "sub_queries": sub_queries,
-                "tools_required": [t.value for t in tools_required],
-                "priority_order": list(range(1, len(sub_queries) + 1)),
-                "estimated_depth": min(len(sub_queries), 2)
-            }
             plan = InvestigationPlan(
                 objective=objective,
-                sub_queries=plan_data.get("sub_queries", []),
-                tools_required=[ToolType(t) for t in plan_data.get("tools_required", [])],
-                priority_order=plan_data.get("priority_order", []),
-                estimated_depth=plan_data.get("estimated_depth", 1)
+                sub_queries=sub_queries,
+                tools_required=tools_required,
+                priority_order=list(range(1, len(sub_queries) + 1)),
+                estimated_depth=min(len(sub_queries), 2)
             )
 
             logger.info(f"Plan created: {len(plan.sub_queries)} queries, {len(plan.tools_required)} tools")
+            self._plan_cache[cache_key] = plan
             return plan
 
         except Exception as e:
@@ -226,23 +260,31 @@ class GuardrAgent:
 
     def _execute_phase(self, plan: InvestigationPlan) -> List[ExecutionResult]:
         """
-        EXECUTE: Run tools in priority order
+        EXECUTE: Run all planned tools concurrently
+
+        Each sub-query is an independent I/O-bound OSINT call (web search +
+        LLM), so dispatching them to a bounded thread pool drops phase latency
+        from the sum of call times to roughly the slowest call.
         """
         logger.info("Phase 2: EXECUTE")
 
-        results = []
-
+        tasks = []
         for idx, query in enumerate(plan.sub_queries):
             tool = plan.tools_required[idx] if idx < len(plan.tools_required) else ToolType.WEB_SEARCH
             priority = plan.priority_order[idx] if idx < len(plan.priority_order) else 999
 
             logger.info(f"Executing: {tool.value} for '{query}' (priority: {priority})")
+            tasks.append((tool, query))
 
-            # Execute tool (placeholder - will implement actual tool calls)
-            result = self._execute_tool(tool, query)
-            results.append(result)
+        if not tasks:
+            return []
 
-        return results
+        # _execute_tool already catches per-tool exceptions, so one failed
+        # query cannot take down its peers; futures preserve plan order.
+        max_workers = min(self.concurrency, len(tasks))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self._execute_tool, tool, query) for tool, query in tasks]
+            return [future.result() for future in futures]
 
     def _execute_tool(self, tool: ToolType, query: str) -> ExecutionResult:
         """
@@ -289,16 +331,6 @@ class GuardrAgent:
         """
         logger.info("Phase 3: REVIEW")
 
-        findings_summary = [
-            {
-                "tool": f.tool.value,
-                "query": f.query,
-                "success": f.success,
-                "confidence": f.confidence
-            }
-            for f in findings
-        ]
-
         # Deterministic review logic
         successful_findings = [f for f in findings if f.success]
         total_confidence = sum(f.confidence for f in successful_findings) / len(findings) if findings else 0.0
@@ -312,17 +344,11 @@ class GuardrAgent:
             gaps.append(f"{len(findings) - len(successful_findings)} investigations failed")
 
         try:
-            assessment_data = {
-                "objective_met": objective_met,
-                "confidence_score": total_confidence,
-                "gaps_identified": gaps,
-                "recommendations": ["Continue investigation" if not objective_met else "Investigation complete"]
-            }
             assessment = ReviewAssessment(
-                objective_met=assessment_data.get("objective_met", False),
-                confidence_score=assessment_data.get("confidence_score", 0.0),
-                gaps_identified=assessment_data.get("gaps_identified", []),
-                recommendations=assessment_data.get("recommendations", [])
+                objective_met=objective_met,
+                confidence_score=total_confidence,
+                gaps_identified=gaps,
+                recommendations=["Continue investigation" if not objective_met else "Investigation complete"]
             )
 
             logger.info(f"Review: objective_met={assessment.objective_met}, confidence={assessment.confidence_score:.2f}")
@@ -373,6 +399,46 @@ class GuardrAgent:
             max_cycles_reached=False
         )
 
+    @staticmethod
+    def _history_entry_as_dict(entry: Dict[str, Any]) -> Dict[str, Any]:
+        """Project one cycle's dataclasses into plain JSON-serializable dicts"""
+        plan = entry["plan"]
+        assessment = entry["assessment"]
+        adjustment = entry["adjustment"]
+        return {
+            "cycle": entry["cycle"],
+            "plan": {
+                "objective": plan.objective,
+                "sub_queries": list(plan.sub_queries),
+                "tools_required": [tool.value for tool in plan.tools_required],
+                "priority_order": list(plan.priority_order),
+                "estimated_depth": plan.estimated_depth,
+            },
+            "results": [
+                {
+                    "tool": result.tool.value,
+                    "query": result.query,
+                    "success": result.success,
+                    "error": result.error,
+                    "confidence": result.confidence,
+                    "data": str(result.data)[:500] if result.data else None,
+                }
+                for result in entry["results"]
+            ],
+            "assessment": {
+                "objective_met": assessment.objective_met,
+                "confidence_score": assessment.confidence_score,
+                "gaps_identified": list(assessment.gaps_identified),
+                "recommendations": list(assessment.recommendations),
+            },
+            "adjustment": {
+                "continue_investigation": adjustment.continue_investigation,
+                "new_queries": list(adjustment.new_queries),
+                "tools_to_add": [tool.value for tool in adjustment.tools_to_add],
+                "max_cycles_reached": adjustment.max_cycles_reached,
+            },
+        }
+
     def _generate_report(self, objective: str, findings: List[ExecutionResult],
                         history: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -388,7 +454,10 @@ class GuardrAgent:
             "total_findings": len(findings),
             "successful_findings": len(successful_findings),
             "final_confidence": history[-1]["assessment"].confidence_score if history else 0.0,
-            "execution_history": history,
+            # Projected to plain dicts so json.dumps(report) emits structured
+            # plan/assessment data instead of default=str flattening the
+            # dataclasses into their reprs.
+            "execution_history": [self._history_entry_as_dict(e) for e in history],
             "findings": [
                 {
                     "tool": f.tool.value,
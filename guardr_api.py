@@ -6,24 +6,51 @@ Provides REST API endpoints for dating safety checks
 
 from flask import Flask, request, jsonify
 from flask_cors import CORS
+from concurrent.futures import ThreadPoolExecutor
 import sys
 import os
 
 # Add Kallisto to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from src.modules.person_lookup import lookup_person
-from src.modules.username_search import search_username
 from src.config import load_config
 from src.utils.logger import get_logger
+from guardr_risk import classify_risk
+import hashlib
 import random
+import threading
+import time
+
+try:  # optional - faster JSON serialization for large OSINT reports
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = get_logger(__name__)
 
 app = Flask(__name__)
 CORS(app)  # Allow requests from frontend
+
+if orjson is not None:
+    from flask.json.provider import JSONProvider
+
+    class OrjsonProvider(JSONProvider):
+        """Serialize Flask responses with orjson instead of stdlib json"""
+
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj).decode('utf-8')
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = OrjsonProvider(app)
 config = load_config()
 
+# Server settings resolved once at import rather than via per-call os.getenv
+PORT = int(os.getenv('PORT', '5000'))
+WEB_CONCURRENCY = int(os.getenv('WEB_CONCURRENCY', '2'))
+GUNICORN_THREADS = int(os.getenv('GUNICORN_THREADS', '4'))
+
 # Safety tips for captive audience during loading
 SAFETY_TIPS = {
     'smart_habits': [
@@ -60,20 +87,63 @@ SAFETY_TIPS = {
     ]
 }
 
+# Flattened at import time so tip selection is a single random.choices call
+# instead of a per-tip category draw plus dict lookup on every request.
+FLAT_SAFETY_TIPS = [
+    {'category': category.replace('_', ' ').title(), 'message': tip}
+    for category, tips in SAFETY_TIPS.items()
+    for tip in tips
+]
+
+# Dedicated generator instance - skips the module-function indirection on
+# random.choices and keeps tip sampling isolated from other random users
+_tip_rng = random.Random()
+
+
 def get_random_safety_tips(count=5):
     """Get random safety tips from different categories"""
-    tips = []
-    categories = list(SAFETY_TIPS.keys())
+    return _tip_rng.choices(FLAT_SAFETY_TIPS, k=count)
+
+
+# Static assessment question shared by every person lookup; keeping it a
+# single module-level constant preserves the cacheable prompt prefix across
+# requests (only the name/location vary per call).
+PERSON_SAFETY_QUESTION = """
+Verify this person's identity and provide a dating safety assessment.
+
+Check for:
+1. Profile authenticity indicators
+2. Potential catfish red flags
+3. Inconsistent information
+4. Social media presence verification
+5. Any safety concerns for dating
 
-    for _ in range(count):
-        category = random.choice(categories)
-        tip = random.choice(SAFETY_TIPS[category])
-        tips.append({
-            'category': category.replace('_', ' ').title(),
-            'message': tip
-        })
+Provide a clear risk assessment (LOW/MEDIUM/HIGH) and specific findings.
+"""
+
+
+def run_person_lookup(name, location):
+    """Run the Kallisto person lookup for a dating safety assessment"""
+    # Imported lazily: pulls in the agent stack and LLM SDKs, which is the
+    # bulk of cold-start time. Health checks and workers that never run a
+    # lookup skip the cost entirely.
+    from src.modules.person_lookup import lookup_person
+
+    return lookup_person(name, PERSON_SAFETY_QUESTION, config, location=location)
 
-    return tips
+
+def run_username_search(username):
+    """Run the Kallisto username search across common dating/social platforms"""
+    from src.modules.username_search import search_username
+
+    platforms = [
+        'https://instagram.com',
+        'https://twitter.com',
+        'https://facebook.com',
+        'https://tinder.com',
+        'https://linkedin.com'
+    ]
+    return search_username(username, platforms, config)
 
 
 @app.route('/api/health', methods=['GET'])
@@ -86,6 +156,159 @@ def health_check():
     })
 
 
+def run_profile_check(email, name, location, username):
+    """Run the full profile check for one profile and return the result dict"""
+    logger.info(f"Profile check requested - email: {email}, name: {name}, location: {location}, username: {username}")
+
+    # Initialize result
+    result = {
+        'email': email if email else None,
+        'name': name if name else None,
+        'location': location if location else None,
+        'username': username if username else None,
+        'risk_level': 'UNKNOWN',
+        'risk_score': 0,
+        'person_verification': None,
+        'username_verification': None,
+        'breach_data': None,
+        'red_flags': [],
+        'recommendations': [],
+        'safety_tips': get_random_safety_tips(5)
+    }
+
+    # Person lookup and username search are independent network+LLM
+    # calls, so run them concurrently and join - request latency becomes
+    # max(person, username) instead of their sum.
+    person_future = None
+    username_future = None
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        if name:
+            logger.info(f"Running person lookup for: {name}")
+            person_future = executor.submit(run_person_lookup, name, location)
+        if username:
+            logger.info(f"Running username search for: {username}")
+            username_future = executor.submit(run_username_search, username)
+
+        if person_future:
+            try:
+                person_report = person_future.result()
+                result['person_verification'] = person_report
+
+                # Parse risk level from report (simple heuristic)
+                result['risk_level'], result['risk_score'] = classify_risk(person_report)
+
+            except Exception as e:
+                logger.error(f"Person lookup failed: {e}")
+                result['person_verification'] = f"Person lookup error: {str(e)}"
+
+        if username_future:
+            try:
+                username_results = username_future.result()
+                result['username_verification'] = username_results
+
+                # Count found profiles
+                found_count = sum(1 for r in username_results if r.get('status') == 'found')
+                if found_count == 0:
+                    result['red_flags'].append(f"Username '{username}' not found on any major platforms")
+                elif found_count >= 3:
+                    result['recommendations'].append("Profile appears on multiple platforms (good sign)")
+
+            except Exception as e:
+                logger.error(f"Username search failed: {e}")
+                result['username_verification'] = f"Username search error: {str(e)}"
+
+    # Add general recommendations
+    if result['risk_level'] == 'HIGH':
+        result['recommendations'].extend([
+            "⚠️ Do NOT meet this person alone",
+            "Consider video chat verification before meeting",
+            "Trust your instincts - if something feels off, it probably is"
+        ])
+    elif result['risk_level'] == 'MEDIUM':
+        result['recommendations'].extend([
+            "Request additional verification (video chat, ID)",
+            "Meet in a public place",
+            "Tell a friend where you're going"
+        ])
+    else:
+        result['recommendations'].extend([
+            "Still meet in a public place for first date",
+            "Share your location with a trusted friend",
+            "Trust your instincts"
+        ])
+
+    logger.info(f"Check completed - risk level: {result['risk_level']}")
+    return result
+
+
+def _extract_profile_fields(data):
+    """Pull the normalized (email, name, location, username) tuple from a request payload"""
+    return (
+        data.get('email', '').strip(),
+        data.get('name', '').strip(),
+        data.get('location', '').strip(),
+        data.get('username', '').strip(),
+    )
+
+
+# Short-lived result cache keyed by input fingerprint. Lets clients revalidate
+# with If-None-Match (304, no body) and spares repeat checks of the same
+# profile from re-running the 60-120s OSINT pipeline within the TTL. Bounded:
+# expired entries are swept and the oldest evicted once the cap is reached,
+# so distinct profiles don't accumulate forever in a long-lived process.
+CHECK_CACHE_TTL = 300  # seconds
+CHECK_CACHE_MAX_ENTRIES = 256
+_check_cache = {}
+_check_cache_lock = threading.Lock()
+
+
+def _profile_fingerprint(email, name, location, username):
+    """Stable fingerprint of the normalized check inputs, used as the ETag"""
+    raw = '\x1f'.join((email.lower(), name.lower(), location.lower(), username.lower()))
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+def _get_cached_check(fingerprint):
+    with _check_cache_lock:
+        entry = _check_cache.get(fingerprint)
+        if entry and time.time() - entry[1] < CHECK_CACHE_TTL:
+            return entry[0]
+        if entry:
+            del _check_cache[fingerprint]
+    return None
+
+
+def _result_has_errors(result):
+    """True when a lookup inside the result failed and embedded its error text"""
+    person = result.get('person_verification')
+    username = result.get('username_verification')
+    return (
+        (isinstance(person, str) and person.startswith('Person lookup error:'))
+        or (isinstance(username, str) and username.startswith('Username search error:'))
+    )
+
+
+def _store_cached_check(fingerprint, result):
+    # Errored runs are not cached - a transient OSINT failure should retry
+    # on the next request instead of being served for the full TTL (same
+    # policy as username_search's result cache).
+    if _result_has_errors(result):
+        return
+    now = time.time()
+    with _check_cache_lock:
+        if len(_check_cache) >= CHECK_CACHE_MAX_ENTRIES:
+            expired = [
+                key for key, (_, stored_at) in _check_cache.items()
+                if now - stored_at >= CHECK_CACHE_TTL
+            ]
+            for key in expired:
+                del _check_cache[key]
+            while len(_check_cache) >= CHECK_CACHE_MAX_ENTRIES:
+                oldest = min(_check_cache, key=lambda key: _check_cache[key][1])
+                del _check_cache[oldest]
+        _check_cache[fingerprint] = (result, now)
+
+
 @app.route('/api/check', methods=['POST'])
 def check_profile():
     """
@@ -104,118 +327,77 @@ def check_profile():
         if not data:
             return jsonify({'error': 'No data provided'}), 400
 
-        email = data.get('email', '').strip()
-        name = data.get('name', '').strip()
-        location = data.get('location', '').strip()
-        username = data.get('username', '').strip()
+        email, name, location, username = _extract_profile_fields(data)
 
         if not any([email, name, username]):
             return jsonify({'error': 'Provide at least one of: email, name, or username'}), 400
 
-        logger.info(f"Profile check requested - email: {email}, name: {name}, location: {location}, username: {username}")
+        fingerprint = _profile_fingerprint(email, name, location, username)
+        cached = _get_cached_check(fingerprint)
 
-        # Initialize result
-        result = {
-            'email': email if email else None,
-            'name': name if name else None,
-            'location': location if location else None,
-            'username': username if username else None,
-            'risk_level': 'UNKNOWN',
-            'risk_score': 0,
-            'person_verification': None,
-            'username_verification': None,
-            'breach_data': None,
-            'red_flags': [],
-            'recommendations': [],
-            'safety_tips': get_random_safety_tips(5)
-        }
+        # Revalidation: same inputs, client already holds the result
+        if cached is not None and fingerprint in request.if_none_match:
+            return '', 304
 
-        # Person lookup using Kallisto
-        if name:
-            logger.info(f"Running person lookup for: {name}")
-            try:
-                question = """
-                Verify this person's identity and provide a dating safety assessment.
-
-                Check for:
-                1. Profile authenticity indicators
-                2. Potential catfish red flags
-                3. Inconsistent information
-                4. Social media presence verification
-                5. Any safety concerns for dating
-
-                Provide a clear risk assessment (LOW/MEDIUM/HIGH) and specific findings.
-                """
-                person_report = lookup_person(name, question, config, location=location)
-                result['person_verification'] = person_report
+        result = cached if cached is not None else run_profile_check(email, name, location, username)
+        if cached is None:
+            _store_cached_check(fingerprint, result)
 
-                # Parse risk level from report (simple heuristic)
-                report_lower = person_report.lower()
-                if any(flag in report_lower for flag in ['high risk', 'dangerous', 'fraud', 'scam', 'fake']):
-                    result['risk_level'] = 'HIGH'
-                    result['risk_score'] = 85
-                elif any(flag in report_lower for flag in ['medium risk', 'suspicious', 'inconsistent', 'verify']):
-                    result['risk_level'] = 'MEDIUM'
-                    result['risk_score'] = 55
-                else:
-                    result['risk_level'] = 'LOW'
-                    result['risk_score'] = 25
+        response = jsonify(result)
+        response.set_etag(fingerprint)
+        return response
 
-            except Exception as e:
-                logger.error(f"Person lookup failed: {e}")
-                result['person_verification'] = f"Person lookup error: {str(e)}"
+    except Exception as e:
+        logger.error(f"API error: {e}")
+        return jsonify({'error': str(e)}), 500
 
-        # Username search using Kallisto
-        if username:
-            logger.info(f"Running username search for: {username}")
-            try:
-                # Common dating/social platforms
-                platforms = [
-                    'https://instagram.com',
-                    'https://twitter.com',
-                    'https://facebook.com',
-                    'https://tinder.com',
-                    'https://linkedin.com'
-                ]
-                username_results = search_username(username, platforms, config)
-                result['username_verification'] = username_results
 
-                # Count found profiles
-                found_count = sum(1 for r in username_results if r.get('status') == 'found')
-                if found_count == 0:
-                    result['red_flags'].append(f"Username '{username}' not found on any major platforms")
-                elif found_count >= 3:
-                    result['recommendations'].append("Profile appears on multiple platforms (good sign)")
+@app.route('/api/check-batch', methods=['POST'])
+def check_profile_batch():
+    """
+    Batch endpoint for checking several profiles in one request
 
+    Request body:
+    {
+        "profiles": [
+            {"name": "...", "location": "...", "username": "...", "email": "..."},
+            ...
+        ]
+    }
+
+    Profiles are checked concurrently; results come back in request order.
+    """
+    try:
+        data = request.json
+        if not data or not isinstance(data.get('profiles'), list):
+            return jsonify({'error': 'Provide a "profiles" list'}), 400
+
+        profiles = data['profiles']
+        if not profiles:
+            return jsonify({'error': 'Profiles list is empty'}), 400
+        if len(profiles) > 10:
+            return jsonify({'error': 'Maximum 10 profiles per batch'}), 400
+
+        def check_one(profile):
+            # Field extraction stays inside the try: a malformed element
+            # (non-dict profile, non-string field) becomes a per-element
+            # error instead of failing the whole batch.
+            try:
+                email, name, location, username = _extract_profile_fields(profile)
+                if not any([email, name, username]):
+                    return {'error': 'Provide at least one of: email, name, or username'}
+                return run_profile_check(email, name, location, username)
             except Exception as e:
-                logger.error(f"Username search failed: {e}")
-                result['username_verification'] = f"Username search error: {str(e)}"
+                logger.error(f"Batch profile check failed: {e}")
+                return {'error': str(e)}
 
-        # Add general recommendations
-        if result['risk_level'] == 'HIGH':
-            result['recommendations'].extend([
-                "⚠️ Do NOT meet this person alone",
-                "Consider video chat verification before meeting",
-                "Trust your instincts - if something feels off, it probably is"
-            ])
-        elif result['risk_level'] == 'MEDIUM':
-            result['recommendations'].extend([
-                "Request additional verification (video chat, ID)",
-                "Meet in a public place",
-                "Tell a friend where you're going"
-            ])
-        else:
-            result['recommendations'].extend([
-                "Still meet in a public place for first date",
-                "Share your location with a trusted friend",
-                "Trust your instincts"
-            ])
-
-        logger.info(f"Check completed - risk level: {result['risk_level']}")
-        return jsonify(result)
+        with ThreadPoolExecutor(max_workers=min(4, len(profiles))) as executor:
+            results = list(executor.map(check_one, profiles))
+
+        return jsonify({'results': results, 'count': len(results)})
 
     except Exception as e:
-        logger.error(f"API error: {e}")
+        logger.error(f"Batch API error: {e}")
         return jsonify({'error': str(e)}), 500
 
 
@@ -252,6 +434,33 @@ def breach_check():
         return jsonify({'error': str(e)}), 500
 
 
+def _serve(host='0.0.0.0', port=5000):
+    """Serve the app with gunicorn (production) or Flask's dev server (debug)"""
+    if config.get('DEBUG_MODE'):
+        logger.info("DEBUG_MODE set - using Flask development server")
+        app.run(host=host, port=port, debug=True)
+        return
+
+    try:
+        from gunicorn.app.base import BaseApplication
+
+        class GuardrApplication(BaseApplication):
+            def load_config(self):
+                self.cfg.set('bind', f"{host}:{port}")
+                self.cfg.set('workers', WEB_CONCURRENCY)
+                self.cfg.set('threads', GUNICORN_THREADS)
+                self.cfg.set('timeout', 300)  # OSINT calls take 60-120s
+
+            def load(self):
+                return app
+
+        logger.info("Serving with gunicorn on %s:%s", host, port)
+        GuardrApplication().run()
+    except ImportError:
+        logger.warning("gunicorn not installed - falling back to threaded dev server")
+        app.run(host=host, port=port, debug=False, threaded=True)
+
+
 if __name__ == '__main__':
     logger.info("Starting Guardr API Server...")
     logger.info("Endpoints:")
@@ -259,8 +468,4 @@ if __name__ == '__main__':
     logger.info("  POST /api/check        - Full profile check (name, location, username)")
     logger.info("  POST /api/breach-check - Email breach check")
 
-    app.run(
-        host='0.0.0.0',
-        port=5000,
-        debug=True
-    )
+    _serve(port=PORT)
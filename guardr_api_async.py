@@ -6,31 +6,187 @@ Provides REST API endpoints with background job processing for long-running OSIN
 
 from flask import Flask, request, jsonify
 from flask_cors import CORS
+import asyncio
 import sys
 import os
 import json
+import time
 import uuid
 import threading
-from datetime import datetime, timedelta
+from datetime import datetime, timezone
 
 # Add Kallisto to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from src.modules.person_lookup import lookup_person
-from src.modules.username_search import search_username
+from src.modules.username_search import search_username_async
 from src.config import load_config
 from src.utils.logger import get_logger
+from guardr_risk import classify_risk
 import random
 
+try:  # optional - durable job queue backend
+    from redis import Redis
+    from rq import Queue
+except ImportError:
+    Redis = None
+    Queue = None
+
+try:  # optional - faster JSON serialization for large OSINT reports
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = get_logger(__name__)
 
 app = Flask(__name__)
 CORS(app)  # Allow requests from frontend
+
+if orjson is not None:
+    from flask.json.provider import JSONProvider
+
+    class OrjsonProvider(JSONProvider):
+        """Serialize Flask responses with orjson instead of stdlib json"""
+
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj).decode('utf-8')
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = OrjsonProvider(app)
 config = load_config()
 
-# In-memory job store (for simplicity - in production use Redis)
-jobs = {}
-jobs_lock = threading.Lock()
+# Job backend: when REDIS_URL is set (and redis/rq are installed) jobs are
+# enqueued to an RQ worker pool and state lives in Redis, surviving restarts
+# and scaling past this process. Otherwise fall back to the in-memory store
+# with one daemon thread per job.
+JOB_TTL = 3600  # seconds a finished job stays retrievable
+
+
+class JobTracker:
+    """
+    In-memory job store with lock-free reads and writes.
+
+    Records are treated as immutable snapshots: updates copy the record,
+    apply the new fields and swap the whole dict entry, which is atomic
+    under the GIL. Each job has a single writer (its worker thread), so
+    readers always see either the old or the new complete record and no
+    lock sits on the hot status-poll path.
+    """
+
+    def __init__(self):
+        self._jobs = {}
+
+    def store(self, job):
+        self._jobs[job['id']] = job
+
+    def load(self, job_id):
+        return self._jobs.get(job_id)
+
+    def update(self, job_id, fields):
+        job = self._jobs.get(job_id)
+        if job is None:
+            return None
+        updated = {**job, **fields}
+        self._jobs[job_id] = updated
+        return updated
+
+
+job_tracker = JobTracker()
+
+_redis_conn = None
+_rq_queue = None
+if Redis is not None and os.getenv('REDIS_URL'):
+    try:
+        _redis_conn = Redis.from_url(os.getenv('REDIS_URL'))
+        _redis_conn.ping()
+        _rq_queue = Queue('guardr-osint', connection=_redis_conn)
+        logger.info("Using Redis/RQ job backend")
+    except Exception as e:
+        logger.warning(f"Redis unavailable ({e}) - falling back to in-process jobs")
+        _redis_conn = None
+        _rq_queue = None
+
+
+def _store_job(job):
+    """Persist a job record to the active backend"""
+    if _redis_conn is not None:
+        _redis_conn.setex(f"guardr:job:{job['id']}", JOB_TTL, json.dumps(job))
+    else:
+        job_tracker.store(job)
+
+
+def _load_job(job_id):
+    """Fetch a job record from the active backend, or None"""
+    if _redis_conn is not None:
+        raw = _redis_conn.get(f"guardr:job:{job_id}")
+        return json.loads(raw) if raw else None
+    return job_tracker.load(job_id)
+
+
+# Completion events for long-polling in the in-process backend; Redis mode
+# falls back to short server-side poll sleeps.
+_job_events = {}
+MAX_LONG_POLL_WAIT = 25  # seconds, keep under typical proxy timeouts
+
+
+def _render_timestamp(ts):
+    """Render an internal epoch-float timestamp as an ISO-8601 UTC string"""
+    if ts is None:
+        return None
+    return datetime.fromtimestamp(ts, tz=timezone.utc).isoformat()
+
+
+def _update_job(job_id, **fields):
+    """Apply field updates to a job record (single writer per job)"""
+    fields['updated_at'] = time.time()
+    if _redis_conn is not None:
+        job = _load_job(job_id)
+        if job is None:
+            return
+        job.update(fields)
+        _store_job(job)
+    elif job_tracker.update(job_id, fields) is None:
+        return
+    if fields.get('status') in ('completed', 'failed'):
+        event = _job_events.get(job_id)
+        if event is not None:
+            event.set()
+
+
+def _wait_for_job(job_id, timeout):
+    """Block server-side until the job finishes or the timeout elapses"""
+    deadline = time.monotonic() + timeout
+    job = _load_job(job_id)
+    while job is not None and job['status'] in ('pending', 'processing'):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        if _redis_conn is None:
+            event = _job_events.setdefault(job_id, threading.Event())
+            event.wait(min(remaining, 1.0))
+        else:
+            time.sleep(min(remaining, 0.5))
+        job = _load_job(job_id)
+    return job
+
+
+def _submit_job(job_id, name, location, username, email):
+    """Dispatch the analysis to RQ when configured, else a daemon thread"""
+    if _rq_queue is not None:
+        _rq_queue.enqueue(
+            run_osint_analysis,
+            job_id, name, location, username, email,
+            job_timeout=600,
+        )
+        return
+    thread = threading.Thread(
+        target=run_osint_analysis,
+        args=(job_id, name, location, username, email)
+    )
+    thread.daemon = True
+    thread.start()
 
 # Safety tips for captive audience during loading
 SAFETY_TIPS = {
@@ -68,20 +224,20 @@ SAFETY_TIPS = {
     ]
 }
 
-def get_random_safety_tips(count=5):
-    """Get random safety tips from different categories"""
-    tips = []
-    categories = list(SAFETY_TIPS.keys())
+# Flattened at import time so tip selection is a single random.choices call
+# instead of a per-tip category draw plus dict lookup on every job.
+FLAT_SAFETY_TIPS = [
+    {'category': category.replace('_', ' ').title(), 'message': tip}
+    for category, tips in SAFETY_TIPS.items()
+    for tip in tips
+]
 
-    for _ in range(count):
-        category = random.choice(categories)
-        tip = random.choice(SAFETY_TIPS[category])
-        tips.append({
-            'category': category.replace('_', ' ').title(),
-            'message': tip
-        })
+_tip_rng = random.Random()
 
-    return tips
+
+def get_random_safety_tips(count=5):
+    """Get random safety tips from different categories"""
+    return _tip_rng.choices(FLAT_SAFETY_TIPS, k=count)
 
 
 def run_osint_analysis(job_id, name, location, username, email):
@@ -90,9 +246,7 @@ def run_osint_analysis(job_id, name, location, username, email):
         logger.info(f"[Job {job_id}] Starting OSINT analysis for: {name}")
 
         # Update job status
-        with jobs_lock:
-            jobs[job_id]['status'] = 'processing'
-            jobs[job_id]['updated_at'] = datetime.utcnow().isoformat()
+        _update_job(job_id, status='processing')
 
         # Initialize result
         result = {
@@ -129,17 +283,8 @@ def run_osint_analysis(job_id, name, location, username, email):
                 person_report = lookup_person(name, question, config, location=location)
                 result['person_verification'] = person_report
 
-                # Parse risk level from report (simple heuristic)
-                report_lower = person_report.lower()
-                if any(flag in report_lower for flag in ['high risk', 'dangerous', 'fraud', 'scam', 'fake']):
-                    result['risk_level'] = 'HIGH'
-                    result['risk_score'] = 85
-                elif any(flag in report_lower for flag in ['medium risk', 'suspicious', 'inconsistent', 'verify']):
-                    result['risk_level'] = 'MEDIUM'
-                    result['risk_score'] = 55
-                else:
-                    result['risk_level'] = 'LOW'
-                    result['risk_score'] = 25
+                # Single precompiled scan per tier over the raw report
+                result['risk_level'], result['risk_score'] = classify_risk(person_report)
 
             except Exception as e:
                 logger.error(f"[Job {job_id}] Person lookup failed: {e}")
@@ -157,7 +302,12 @@ def run_osint_analysis(job_id, name, location, username, email):
                     'https://tinder.com',
                     'https://linkedin.com'
                 ]
-                username_results = search_username(username, platforms, config)
+                # All platform checks fan out as coroutines on one event
+                # loop and a single pooled session, instead of a thread
+                # (and a fresh connection) per platform.
+                username_results = asyncio.run(
+                    search_username_async(username, platforms, config)
+                )
                 result['username_verification'] = username_results
 
                 # Count found profiles
@@ -192,20 +342,18 @@ def run_osint_analysis(job_id, name, location, username, email):
             ])
 
         # Update job with results
-        with jobs_lock:
-            jobs[job_id]['status'] = 'completed'
-            jobs[job_id]['result'] = result
-            jobs[job_id]['updated_at'] = datetime.utcnow().isoformat()
-            jobs[job_id]['completed_at'] = datetime.utcnow().isoformat()
+        _update_job(
+            job_id,
+            status='completed',
+            result=result,
+            completed_at=time.time(),
+        )
 
         logger.info(f"[Job {job_id}] Analysis completed - risk level: {result['risk_level']}")
 
     except Exception as e:
         logger.error(f"[Job {job_id}] Analysis failed with error: {e}", exc_info=True)
-        with jobs_lock:
-            jobs[job_id]['status'] = 'failed'
-            jobs[job_id]['error'] = str(e)
-            jobs[job_id]['updated_at'] = datetime.utcnow().isoformat()
+        _update_job(job_id, status='failed', error=str(e))
 
 
 @app.route('/api/health', methods=['GET'])
@@ -240,11 +388,16 @@ def check_profile_async():
 
         # Create job
         job_id = str(uuid.uuid4())
+        # Timestamps live as epoch floats internally; they are rendered to
+        # ISO-8601 only at the JSON boundary in get_job_status. A datetime
+        # allocation plus isoformat on every status transition is pure
+        # overhead when the store only needs ordering.
+        now = time.time()
         job = {
             'id': job_id,
             'status': 'pending',
-            'created_at': datetime.utcnow().isoformat(),
-            'updated_at': datetime.utcnow().isoformat(),
+            'created_at': now,
+            'updated_at': now,
             'input': {
                 'email': email if email else None,
                 'name': name if name else None,
@@ -255,16 +408,8 @@ def check_profile_async():
             'error': None
         }
 
-        with jobs_lock:
-            jobs[job_id] = job
-
-        # Start background thread
-        thread = threading.Thread(
-            target=run_osint_analysis,
-            args=(job_id, name, location, username, email)
-        )
-        thread.daemon = True
-        thread.start()
+        _store_job(job)
+        _submit_job(job_id, name, location, username, email)
 
         logger.info(f"[Job {job_id}] Created async job for: {name or username or email}")
 
@@ -290,9 +435,20 @@ def get_job_status(job_id):
     - processing: Job is running
     - completed: Job finished successfully (includes result)
     - failed: Job encountered an error
+
+    Pass ?wait=<seconds> (max 25) to long-poll: the server holds the request
+    until the job finishes or the wait elapses, instead of the client
+    hammering the endpoint with short polls.
     """
-    with jobs_lock:
-        job = jobs.get(job_id)
+    try:
+        wait = min(float(request.args.get('wait', 0)), MAX_LONG_POLL_WAIT)
+    except ValueError:
+        wait = 0
+
+    if wait > 0:
+        job = _wait_for_job(job_id, wait)
+    else:
+        job = _load_job(job_id)
 
     if not job:
         return jsonify({'error': 'Job not found'}), 404
@@ -300,13 +456,13 @@ def get_job_status(job_id):
     response = {
         'job_id': job['id'],
         'status': job['status'],
-        'created_at': job['created_at'],
-        'updated_at': job['updated_at']
+        'created_at': _render_timestamp(job['created_at']),
+        'updated_at': _render_timestamp(job['updated_at'])
     }
 
     if job['status'] == 'completed':
         response['result'] = job['result']
-        response['completed_at'] = job.get('completed_at')
+        response['completed_at'] = _render_timestamp(job.get('completed_at'))
     elif job['status'] == 'failed':
         response['error'] = job.get('error')
 
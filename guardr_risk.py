@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+Guardr risk classification helpers
+Shared keyword-based risk scoring for the sync and async API servers
+"""
+
+import re
+
+# Keyword tiers used to grade person-verification reports
+HIGH_RISK_KEYWORDS = ('high risk', 'dangerous', 'fraud', 'scam', 'fake')
+MEDIUM_RISK_KEYWORDS = ('medium risk', 'suspicious', 'inconsistent', 'verify')
+
+# Compiled once into single case-insensitive alternation patterns so each
+# report is scanned in one pass per tier, directly on the raw text - no
+# lowercased copy of the (potentially long) report is allocated.
+_HIGH_RISK_PATTERN = re.compile("|".join(map(re.escape, HIGH_RISK_KEYWORDS)), re.IGNORECASE)
+_MEDIUM_RISK_PATTERN = re.compile("|".join(map(re.escape, MEDIUM_RISK_KEYWORDS)), re.IGNORECASE)
+
+
+def classify_risk(report):
+    """
+    Classify a verification report into (risk_level, risk_score).
+
+    Matching is case-insensitive on the raw report text.
+    Returns ('HIGH', 85), ('MEDIUM', 55) or ('LOW', 25).
+    """
+    if _HIGH_RISK_PATTERN.search(report):
+        return 'HIGH', 85
+    if _MEDIUM_RISK_PATTERN.search(report):
+        return 'MEDIUM', 55
+    return 'LOW', 25
@@ -9,8 +9,8 @@ from src.utils.logger import get_logger
 logger = get_logger(__name__)
 
 class DeepDiveAgent(WebAgent):
-    def __init__(self, query, config, deep_dive_topic):
-        super().__init__(query, config, deep_dive_topic)
+    def __init__(self, query, config, deep_dive_topic, llm_client=None):
+        super().__init__(query, config, deep_dive_topic, llm_client=llm_client)
         self.deep_dive_topic = deep_dive_topic
 
     def perform_search(self):
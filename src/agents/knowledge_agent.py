@@ -4,8 +4,8 @@ Orchestrates the overall OSINT task by coordinating web agents.
 It spawns initial and deep-dive agents based on the gathered information.
 """
 
-import time
-import threading
+from concurrent.futures import ThreadPoolExecutor
+
 from src.agents.web_agent import WebAgent
 from src.agents.deep_dive_agent import DeepDiveAgent
 from src.llm.llm_client import LLMClient
@@ -14,69 +14,111 @@ from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Templates split around their knowledge slot at import time. Prompts are
+# then assembled with one join over the accumulated knowledge chunks, so a
+# multi-round knowledge buffer (easily >1 MB) is never materialized as an
+# intermediate string only to be copied again by str.format.
+_DEEP_DIVE_PREFIX, _DEEP_DIVE_SUFFIX = PROMPT_DEEP_DIVE.split("{knowledge}")
+_SUMMARY_PREFIX, _SUMMARY_SUFFIX = PROMPT_SUMMARY.split("{knowledge}")
+
+
 class KnowledgeAgent:
     def __init__(self, query, config, rounds=1):
         self.query = query
         self.config = config
         self.rounds = rounds
         self.llm_client = LLMClient.from_config(config)
-        self.full_knowledge = ""
+        # Knowledge is accumulated as chunks and joined on read; appending to
+        # a growing string copies the whole buffer on every summary.
+        self._knowledge_parts = []
+
+    @property
+    def full_knowledge(self):
+        return "".join(self._knowledge_parts)
+
+    @full_knowledge.setter
+    def full_knowledge(self, value):
+        self._knowledge_parts = [value] if value else []
 
     def spawn_initial_agent(self):
         logger.info("KnowledgeAgent: Spawning initial web agent.")
-        agent = WebAgent(query=self.query, config=self.config)
+        agent = WebAgent(query=self.query, config=self.config, llm_client=self.llm_client)
         initial_summary = agent.run()
         return initial_summary
 
+    # Bounded pool instead of a thread per topic: keeps peak thread count and
+    # provider pressure predictable however many topics the LLM suggests.
+    MAX_DEEP_DIVE_WORKERS = 4
+
     def spawn_deep_dive_agents(self, topics):
         logger.info("KnowledgeAgent: Spawning deep dive agents for topics: %s", topics)
-        summaries = []
-        threads = []
-        lock = threading.Lock()
+        if not topics:
+            return []
 
         def run_agent(topic):
-            agent = DeepDiveAgent(query=self.query, config=self.config, deep_dive_topic=topic)
-            summary = agent.run()
-            with lock:
-                summaries.append((topic, summary))
-
-        for topic in topics:
-            t = threading.Thread(target=run_agent, args=(topic,))
-            t.start()
-            threads.append(t)
-            time.sleep(2.0)  # increased delay to avoid rate limiting
-
-        for t in threads:
-            t.join()
-        return summaries
-
-    def determine_deep_dive_topics(self, current_knowledge):
+            agent = DeepDiveAgent(
+                query=self.query,
+                config=self.config,
+                deep_dive_topic=topic,
+                llm_client=self.llm_client,
+            )
+            return topic, agent.run()
+
+        max_workers = min(self.MAX_DEEP_DIVE_WORKERS, len(topics))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(run_agent, topics))
+
+    def determine_deep_dive_topics(self, current_knowledge=None):
         """
         Uses the LLM client with a prompt template to determine deep-dive topics.
+
+        When no explicit knowledge is passed, the prompt is joined straight
+        from the internal knowledge chunks.
         """
-        prompt = PROMPT_DEEP_DIVE.format(knowledge=current_knowledge)
+        if current_knowledge is None:
+            prompt = "".join([_DEEP_DIVE_PREFIX, *self._knowledge_parts, _DEEP_DIVE_SUFFIX])
+        else:
+            prompt = f"{_DEEP_DIVE_PREFIX}{current_knowledge}{_DEEP_DIVE_SUFFIX}"
         response = self.llm_client.call_llm(prompt)
         topics = [t.strip() for t in response.split(",") if t.strip()]
         logger.info("Determined deep dive topics: %s", topics)
         return topics
 
-    def aggregate_knowledge(self):
+    def aggregate_knowledge_iter(self):
+        """
+        Incremental variant of :meth:`aggregate_knowledge`.
+
+        Yields each knowledge chunk (the initial summary, then one chunk per
+        deep-dive topic) as it is produced, while still accumulating it
+        internally so :meth:`answer_final_question` works afterwards.
+        Callers can stream chunks straight to stdout or disk instead of
+        waiting for the full buffer to assemble.
+        """
         logger.info("KnowledgeAgent: Aggregating knowledge...")
         initial_knowledge = self.spawn_initial_agent()
-        self.full_knowledge += f"Initial Knowledge:\n{initial_knowledge}\n"
+        chunk = f"Initial Knowledge:\n{initial_knowledge}\n"
+        self._knowledge_parts.append(chunk)
+        yield chunk
 
         for r in range(self.rounds):
             logger.info("KnowledgeAgent: Deep dive round %d", r+1)
-            topics = self.determine_deep_dive_topics(self.full_knowledge)
+            topics = self.determine_deep_dive_topics()
             deep_dive_summaries = self.spawn_deep_dive_agents(topics)
             for topic, summary in deep_dive_summaries:
-                self.full_knowledge += f"\nDeep Dive on {topic}:\n{summary}\n"
+                chunk = f"\nDeep Dive on {topic}:\n{summary}\n"
+                self._knowledge_parts.append(chunk)
+                yield chunk
+
+    def aggregate_knowledge(self):
+        for _ in self.aggregate_knowledge_iter():
+            pass
         return self.full_knowledge
 
     def answer_final_question(self, question):
         """
         Uses the aggregated knowledge and a final prompt to answer a question.
         """
-        prompt = PROMPT_SUMMARY.format(knowledge=self.full_knowledge, question=question)
+        suffix = _SUMMARY_SUFFIX.format(question=question)
+        prompt = "".join([_SUMMARY_PREFIX, *self._knowledge_parts, suffix])
         answer = self.llm_client.call_llm(prompt)
         return answer
@@ -4,8 +4,9 @@ This agent is responsible for performing searches and scraping content from the
 It integrates search, read_link and LLM summarization.
 """
 
-import time
 import threading
+from concurrent.futures import ThreadPoolExecutor
+
 from src.tools import search, read_link, llm_map_reduce
 from src.llm.llm_client import LLMClient
 from src.utils.logger import get_logger
@@ -13,15 +14,27 @@ from src.utils.logger import get_logger
 logger = get_logger(__name__)
 
 class WebAgent:
-    def __init__(self, query, config, deep_dive_topic=None):
+    def __init__(self, query, config, deep_dive_topic=None, llm_client=None):
         self.query = query
         self.config = config
         self.deep_dive_topic = deep_dive_topic
-        self.llm_client = LLMClient.from_config(config)
+        # Reuse the orchestrator's client (and its pooled transport) when
+        # given one instead of cold-starting a client per agent.
+        self.llm_client = llm_client if llm_client is not None else LLMClient.from_config(config)
         self.results = []
-        self.summary = ""
+        # Per-URL summaries are collected as chunks and joined once at the
+        # end of run() rather than rebuilt with += under the lock.
+        self._summary_parts = []
         self.lock = threading.Lock()
 
+    @property
+    def summary(self):
+        return "".join(self._summary_parts)
+
+    @summary.setter
+    def summary(self, value):
+        self._summary_parts = [value] if value else []
+
     def perform_search(self):
         """
         Performs a search using the serper API.
@@ -42,22 +55,26 @@ class WebAgent:
             html_content = read_link.read_url(url, config=self.config)
             summary = llm_map_reduce.map_reduce(html_content, self.llm_client)
             with self.lock:
-                self.summary += f"\nURL: {url}\nSummary: {summary}\n"
+                self._summary_parts.append(f"\nURL: {url}\nSummary: {summary}\n")
         except Exception as e:
             logger.error("Failed to fetch or summarize %s: %s", url, str(e))
 
+    # Bounded pool instead of a thread (and staggered sleep) per URL
+    MAX_FETCH_WORKERS = 5
+
     def run(self):
         """
         Runs the full workflow: search, then fetch and summarize results.
         """
         self.perform_search()
-        threads = []
-        for result in self.results:
-            t = threading.Thread(target=self.fetch_and_summarize, args=(result['link'],))
-            t.start()
-            threads.append(t)
-            time.sleep(1.0)  # increased delay to avoid rate limiting
-
-        for t in threads:
-            t.join()
+        if not self.results:
+            return self.summary
+
+        # fetch_and_summarize goes through read_link's scraping-service
+        # fallback chain, so the pooled session in src.utils.http handles
+        # connection reuse; the LLM client enforces its own rate limit.
+        max_workers = min(self.MAX_FETCH_WORKERS, len(self.results))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            executor.map(self.fetch_and_summarize, [r['link'] for r in self.results])
+
         return self.summary
@@ -5,12 +5,13 @@ Supports proxy rotation and randomized user agents.
 """
 
 import asyncio
+import itertools
+
 import aiohttp
 import httpx
-import random
 from typing import Optional
 
-from tenacity import retry, stop_after_attempt, wait_fixed
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_random_exponential
 
 from src.utils.user_agents import get_random_user_agent
 from src.utils.logger import get_logger
@@ -40,68 +41,188 @@ class AsyncRateLimiter:
             self._last_call = now
 
 
-async def fetch_url(session, url, proxy=None, timeout=10):
+# Shared sessions keyed by running event loop (aiohttp sessions are
+# loop-bound). Repeated standalone async_fetch calls on the same loop reuse
+# one connection pool instead of a TCP+TLS handshake per call.
+_shared_sessions = {}
+
+
+def _close_orphaned_session(session: aiohttp.ClientSession) -> None:
+    """Best-effort teardown of a session whose event loop has closed.
+
+    ``ClientSession.close()`` is a coroutine and cannot run on a dead loop,
+    so release the pooled sockets through the connector and detach it so
+    the session is marked closed.
+    """
+    connector = session.connector
+    session.detach()
+    if connector is not None and not connector.closed:
+        try:
+            connector._close()
+        except Exception:  # pragma: no cover - depends on transport state
+            logger.debug("Could not close connector for a closed loop", exc_info=True)
+
+
+def _get_shared_session() -> aiohttp.ClientSession:
+    loop = asyncio.get_running_loop()
+    # Sweep sessions whose loop has since closed (asyncio.run-style
+    # callers): their entries would otherwise pin dead loops, sessions and
+    # pooled sockets for the life of the process.
+    for stale_loop in [l for l in _shared_sessions if l.is_closed()]:
+        _close_orphaned_session(_shared_sessions.pop(stale_loop))
+    session = _shared_sessions.get(loop)
+    if session is None or session.closed:
+        session = aiohttp.ClientSession()
+        _shared_sessions[loop] = session
+    return session
+
+
+async def close_shared_sessions() -> None:
+    """Closes any shared sessions owned by the current loop."""
+    loop = asyncio.get_running_loop()
+    session = _shared_sessions.pop(loop, None)
+    if session is not None and not session.closed:
+        await session.close()
+
+
+async def fetch_url(session, url, proxy=None, timeout=10, extractor=None):
     """
     Asynchronously fetches a URL using aiohttp.
+
+    ``extractor`` is an optional callable applied to the response body before
+    it is returned (e.g. ``llm_map_reduce.clean_html``). Stripping page
+    chrome at fetch time keeps a large gathered batch holding kilobytes of
+    text per URL instead of megabytes of raw HTML.
     """
     headers = {"User-Agent": get_random_user_agent()}
     try:
         async with session.get(url, proxy=proxy, headers=headers, timeout=timeout) as response:
             text = await response.text()
             logger.info("Fetched URL: %s with status: %s", url, response.status)
+            if extractor is not None:
+                try:
+                    text = extractor(text)
+                except Exception as e:
+                    logger.error("Extractor failed for URL %s: %s", url, str(e))
             return {"url": url, "status": response.status, "content": text}
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        # Transient transport failures propagate so async_fetch's retry
+        # policy can see and retry them.
+        logger.warning("Transient error fetching URL %s: %s", url, str(e))
+        raise
     except Exception as e:
         logger.error("Error fetching URL %s: %s", url, str(e))
         return {"url": url, "status": "error", "content": ""}
 
-@retry(stop=stop_after_attempt(3), wait=wait_fixed(2))
-async def async_fetch(
+# Jittered exponential backoff: a fixed 2s wait retries every failed URL in
+# lockstep when a batch hits a flaky proxy, re-spiking the same target. Only
+# transient transport errors are retried; 4xx responses come back as normal
+# results from fetch_url and never burn retry attempts.
+@retry(
+    stop=stop_after_attempt(3),
+    wait=wait_random_exponential(multiplier=0.5, max=10),
+    retry=retry_if_exception_type((aiohttp.ClientError, asyncio.TimeoutError)),
+    reraise=True,
+)
+async def _fetch_with_retry(
     url,
-    proxy=None,
-    *,
-    session: Optional[aiohttp.ClientSession] = None,
-    semaphore: Optional[asyncio.Semaphore] = None,
-    rate_limiter: Optional[AsyncRateLimiter] = None,
+    proxy,
+    session: Optional[aiohttp.ClientSession],
+    semaphore: Optional[asyncio.Semaphore],
+    rate_limiter: Optional[AsyncRateLimiter],
+    extractor,
 ):
-    """
-    Retries fetching a URL asynchronously with aiohttp.
-    """
     async def _do_fetch(client_session: aiohttp.ClientSession):
         if rate_limiter:
             await rate_limiter.acquire()
         if semaphore:
             async with semaphore:
-                return await fetch_url(client_session, url, proxy=proxy)
-        return await fetch_url(client_session, url, proxy=proxy)
+                return await fetch_url(client_session, url, proxy=proxy, extractor=extractor)
+        return await fetch_url(client_session, url, proxy=proxy, extractor=extractor)
 
     if session is not None:
         return await _do_fetch(session)
 
-    async with aiohttp.ClientSession() as own_session:
-        return await _do_fetch(own_session)
+    # No explicit session: reuse the loop's shared pooled session rather
+    # than opening and tearing one down per call. Long-lived loops can call
+    # close_shared_sessions() on shutdown.
+    return await _do_fetch(_get_shared_session())
+
 
-async def fetch_all(urls, proxies=None, *, max_concurrent=5, rate_limit_interval=0.0):
+async def async_fetch(
+    url,
+    proxy=None,
+    *,
+    session: Optional[aiohttp.ClientSession] = None,
+    semaphore: Optional[asyncio.Semaphore] = None,
+    rate_limiter: Optional[AsyncRateLimiter] = None,
+    extractor=None,
+):
+    """
+    Retries fetching a URL asynchronously with aiohttp.
+
+    Transient transport errors are retried with jittered backoff; once the
+    attempts are exhausted the failure is returned as a normal error result
+    so batch callers keep one entry per URL.
+    """
+    try:
+        return await _fetch_with_retry(url, proxy, session, semaphore, rate_limiter, extractor)
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        logger.error("Error fetching URL %s after retries: %s", url, str(e))
+        return {"url": url, "status": "error", "content": ""}
+
+async def fetch_all(urls, proxies=None, *, max_concurrent=5, rate_limit_interval=0.0, extractor=None):
     """
     Fetches multiple URLs asynchronously.
-    Rotates proxies if provided.
+    Rotates proxies if provided; an optional ``extractor`` is applied to each
+    body at fetch time so only the reduced text is buffered for the batch.
+
+    Work is drained from a queue by ``max_concurrent`` worker coroutines
+    rather than scheduling one task per URL up-front, so a 300-platform
+    username scan allocates a handful of coroutines instead of hundreds.
+    Results come back in input order.
     """
-    semaphore = asyncio.Semaphore(max_concurrent) if max_concurrent else None
+    urls = list(urls)
     rate_limiter = AsyncRateLimiter(rate_limit_interval) if rate_limit_interval else None
 
-    async with aiohttp.ClientSession() as session:
-        tasks = []
-        for url in urls:
-            proxy = random.choice(proxies) if proxies else None
-            tasks.append(
-                async_fetch(
-                    url,
-                    proxy,
-                    session=session,
-                    semaphore=semaphore,
-                    rate_limiter=rate_limiter,
-                )
+    # Round-robin spreads load evenly across proxies (random.choice can
+    # hammer one proxy past its per-minute cap while idling another).
+    proxy_iter = itertools.cycle(proxies) if proxies else None
+
+    worker_count = max(1, min(max_concurrent or len(urls), len(urls) or 1))
+
+    queue = asyncio.Queue()
+    for index, url in enumerate(urls):
+        proxy = next(proxy_iter) if proxy_iter else None
+        queue.put_nowait((index, url, proxy))
+
+    results = [None] * len(urls)
+
+    # Connector tuned for OSINT fan-out: cap concurrent connections per host
+    # so a batch aimed at one platform doesn't hammer it, and cache DNS so
+    # repeated fetches against the same domains skip re-resolution.
+    connector = aiohttp.TCPConnector(
+        limit=max(2 * worker_count, 10),
+        limit_per_host=4,
+        ttl_dns_cache=300,
+    )
+
+    async def worker(session):
+        while True:
+            try:
+                index, url, proxy = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            results[index] = await async_fetch(
+                url,
+                proxy,
+                session=session,
+                rate_limiter=rate_limiter,
+                extractor=extractor,
             )
-        results = await asyncio.gather(*tasks)
+
+    async with aiohttp.ClientSession(connector=connector) as session:
+        await asyncio.gather(*(worker(session) for _ in range(worker_count)))
     return results
 
 def async_scrape_urls(urls, proxies=None, *, max_concurrent=5, rate_limit_interval=0.0):
@@ -148,9 +269,10 @@ async def httpx_fetch_all(urls, proxies=None, *, max_concurrent=5, rate_limit_in
                 return await httpx_fetch(url, proxy)
         return await httpx_fetch(url, proxy)
 
+    proxy_iter = itertools.cycle(proxies) if proxies else None
     tasks = []
     for url in urls:
-        proxy = random.choice(proxies) if proxies else None
+        proxy = next(proxy_iter) if proxy_iter else None
         tasks.append(_wrapped_fetch(url, proxy))
     results = await asyncio.gather(*tasks)
     return results
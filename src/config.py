@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+import copy
 import json
 import os
 from typing import Any, Dict, List
 
+try:  # optional - faster parse for large PROXY_LIST payloads
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def _env_to_bool(value: str | None, default: bool = False) -> bool:
     """Coerce an environment string to a boolean."""
@@ -15,8 +21,14 @@ def _env_to_bool(value: str | None, default: bool = False) -> bool:
     return value.strip().lower() in {"1", "true", "yes", "on"}
 
 
-def load_config() -> Dict[str, Any]:
-    """Load configuration from environment variables."""
+# Built once per process; the environment is read ~15 times and PROXY_LIST
+# parsed on every build, which is pure repeated work for hot call sites that
+# construct agents or clients per request.
+_cached_config: Dict[str, Any] | None = None
+
+
+def _build_config() -> Dict[str, Any]:
+    """Read configuration from environment variables."""
 
     if provider_order_env := os.getenv("LLM_PROVIDER_ORDER"):
         provider_order: List[str] = [
@@ -60,8 +72,12 @@ def load_config() -> Dict[str, Any]:
         proxies = []
     else:
         try:
-            loaded = json.loads(proxy_value)
-        except json.JSONDecodeError:
+            if orjson is not None:
+                loaded = orjson.loads(proxy_value)
+            else:
+                loaded = json.loads(proxy_value)
+        except (json.JSONDecodeError, ValueError):
+            # orjson raises its own JSONDecodeError, a ValueError subclass
             loaded = None
 
         if isinstance(loaded, list):
@@ -79,3 +95,25 @@ def load_config() -> Dict[str, Any]:
         config["LOG_LEVEL"] = config["LOG_LEVEL"].upper()
 
     return config
+
+
+def load_config() -> Dict[str, Any]:
+    """Load configuration from environment variables.
+
+    The environment is read once per process; each call returns a deep copy
+    of the cached result so callers may freely mutate their dict. Call
+    :func:`reload_config` after changing the environment at runtime.
+    """
+
+    global _cached_config
+    if _cached_config is None:
+        _cached_config = _build_config()
+    return copy.deepcopy(_cached_config)
+
+
+def reload_config() -> Dict[str, Any]:
+    """Drop the cached configuration and re-read the environment."""
+
+    global _cached_config
+    _cached_config = None
+    return load_config()
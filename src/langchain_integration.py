@@ -4,27 +4,57 @@ This module integrates LangChain to create chains that process OSINT results.
 Provides classes to build, run, and visualize LangChain pipelines.
 """
 
-from langchain.chains import LLMChain
-from langchain.llms import OpenAI
-from langchain.prompts import PromptTemplate
 from src.config import load_config
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 class LangChainIntegrator:
+    # LangChain classes resolved on first instantiation and cached on the
+    # class: langchain's import chain is slow enough that scripts which only
+    # transitively import this module shouldn't pay for it.
+    _LLMChain = None
+    _OpenAI = None
+    _PromptTemplate = None
+
+    @classmethod
+    def _resolve_langchain(cls):
+        if cls._LLMChain is None:
+            from langchain.chains import LLMChain
+            from langchain.llms import OpenAI
+            from langchain.prompts import PromptTemplate
+            cls._LLMChain = LLMChain
+            cls._OpenAI = OpenAI
+            cls._PromptTemplate = PromptTemplate
+
     def __init__(self, api_key=None):
+        self._resolve_langchain()
         config = load_config()
         self.api_key = api_key if api_key else config.get('OPENAI_API_KEY', '')
-        self.llm = OpenAI(api_key=self.api_key, model_name="gpt-4", temperature=0.7)
+        self.llm = self._OpenAI(api_key=self.api_key, model_name="gpt-4", temperature=0.7)
         self.chain = None
+        # Chains cached per (template, variables, output_key): template
+        # construction re-parses the template string on every build, which
+        # advanced_chain would otherwise pay on each invocation.
+        self._chain_cache = {}
+
+    def _get_or_build_chain(self, prompt_template, input_vars, output_key=None):
+        key = (prompt_template, input_vars, output_key)
+        chain = self._chain_cache.get(key)
+        if chain is None:
+            prompt = self._PromptTemplate(template=prompt_template, input_variables=list(input_vars))
+            if output_key is not None:
+                chain = self._LLMChain(llm=self.llm, prompt=prompt, output_key=output_key)
+            else:
+                chain = self._LLMChain(llm=self.llm, prompt=prompt)
+            self._chain_cache[key] = chain
+        return chain
 
     def build_chain(self, prompt_template, output_key="output"):
         """
-        Builds a LangChain LLMChain with the provided prompt template.
+        Builds (or reuses) a LangChain LLMChain with the provided prompt template.
         """
-        prompt = PromptTemplate(template=prompt_template, input_variables=["input"])
-        self.chain = LLMChain(llm=self.llm, prompt=prompt, output_key=output_key)
+        self.chain = self._get_or_build_chain(prompt_template, ("input",), output_key)
         logger.info("LangChain chain built with template: %s", prompt_template)
         return self.chain
 
@@ -53,10 +83,9 @@ class LangChainIntegrator:
 
     def build_custom_chain(self, prompt_template, input_vars):
         """
-        Builds a custom chain with dynamic input variables.
+        Builds (or reuses) a custom chain with dynamic input variables.
         """
-        prompt = PromptTemplate(template=prompt_template, input_variables=input_vars)
-        custom_chain = LLMChain(llm=self.llm, prompt=prompt)
+        custom_chain = self._get_or_build_chain(prompt_template, tuple(input_vars))
         logger.info("Custom LangChain chain built with variables: %s", input_vars)
         return custom_chain
 
@@ -68,12 +97,27 @@ class LangChainIntegrator:
         result = custom_chain.run(input_dict)
         return result
 
+# Integrators cached per API key: constructing one builds an OpenAI client
+# (pool setup, key validation) and reloads config, which is wasted work when
+# the pipeline helpers run in a loop over OSINT records.
+_integrators = {}
+
+
+def _get_integrator(api_key=None):
+    """Returns a shared LangChainIntegrator for the given (or default) key."""
+    integrator = _integrators.get(api_key)
+    if integrator is None:
+        integrator = LangChainIntegrator(api_key=api_key)
+        _integrators[api_key] = integrator
+    return integrator
+
+
 # Additional helper functions for LangChain integration.
 def run_langchain_pipeline(osint_data):
     """
     Convenience function to run a full LangChain pipeline on OSINT data.
     """
-    integrator = LangChainIntegrator()
+    integrator = _get_integrator()
     result = integrator.advanced_chain(osint_data)
     return result
 
@@ -82,7 +126,7 @@ def debug_langchain_integrator():
     Runs a sample LangChain pipeline for debugging purposes.
     """
     sample_data = "Test OSINT data: A person with notable online presence in cybersecurity."
-    integrator = LangChainIntegrator()
+    integrator = _get_integrator()
     chain = integrator.build_chain("Summarize the following OSINT data:\n\n{input}\n\nSummary:")
     result = integrator.run_chain(sample_data)
     logger.debug("Debug LangChain result: %s", result)
@@ -7,34 +7,72 @@ and finally Mistral if earlier providers fail.
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import importlib
+import io
+import json
 import threading
 import time
-from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+from operator import attrgetter
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
 
+from src.utils.cache import Cache
 from src.utils.logger import get_logger
 # KilocodeClient removed
 
-try:  # pragma: no cover - optional dependency
-    from openai import OpenAI
-except ImportError:  # pragma: no cover - handled gracefully
-    OpenAI = None  # type: ignore
+logger = get_logger(__name__)
 
-try:  # pragma: no cover - optional dependency
-    from anthropic import Anthropic
-except ImportError:  # pragma: no cover - handled gracefully
-    Anthropic = None  # type: ignore
+# Provider SDKs are resolved lazily on first use rather than imported at
+# module load: eagerly importing every SDK adds cold-start latency and
+# memory even for deployments that only ever configure one provider.
+_SDK_IMPORTS = {
+    "openai": ("openai", "OpenAI"),
+    "anthropic": ("anthropic", "Anthropic"),
+    "mistral": ("mistralai.client", "MistralClient"),
+    "mistral_chat_message": ("mistralai.models.chat_completion", "ChatMessage"),
+}
 
-try:  # pragma: no cover - optional dependency
-    from mistralai.client import MistralClient
-    from mistralai.models.chat_completion import ChatMessage
-except ImportError:  # pragma: no cover - handled gracefully
-    MistralClient = None  # type: ignore
-    ChatMessage = None  # type: ignore
 
-logger = get_logger(__name__)
+# Deterministic (temperature <= 0) responses are cached across client
+# instances, keyed on the full request tuple (system prompt, prompt,
+# temperature, token limit, resolved models): structured OSINT prompts
+# repeat often, and each duplicate is a paid API call plus a rate-limit
+# sleep. Sampled calls are never cached - their output is meant to vary.
+# Created lazily so importing this module has no filesystem side effects.
+_RESPONSE_CACHE_MAX_AGE = 86400  # seconds
+
+# C-level extractor for Anthropic content blocks, bound once at import.
+_get_block_text = attrgetter("text")
+_response_cache: Optional[Cache] = None
+_response_cache_lock = threading.Lock()
+
+
+def _get_response_cache() -> Cache:
+    global _response_cache
+    if _response_cache is None:
+        with _response_cache_lock:
+            if _response_cache is None:
+                _response_cache = Cache()
+    return _response_cache
+
+
+@lru_cache(maxsize=None)
+def _resolve_sdk(name: str) -> Optional[Any]:
+    """Import and return an SDK class by registry name, or None if absent."""
+
+    module_name, attr = _SDK_IMPORTS[name]
+    try:  # pragma: no cover - optional dependency
+        return getattr(importlib.import_module(module_name), attr)
+    except ImportError:  # pragma: no cover - handled gracefully
+        return None
 
 _DEFAULT_SYSTEM_PROMPT = "You are an OSINT assistant."
+# Ordered tuple for default iteration order, frozenset for membership tests
 _SUPPORTED_PROVIDERS = ("openai", "anthropic", "mistral")
+_SUPPORTED_PROVIDER_SET = frozenset(_SUPPORTED_PROVIDERS)
 _DEFAULT_PROVIDER_ORDER = list(_SUPPORTED_PROVIDERS)
 _DEFAULT_PROVIDER_MODELS = {
     "openai": "gpt-4",
@@ -47,6 +85,20 @@ _DEFAULT_PROVIDER_MODELS = {
 class LLMClient:
     """Wrapper around multiple LLM providers with fallback support."""
 
+    # Circuit breaker: after CB_THRESHOLD consecutive failures a provider is
+    # skipped for CB_COOLDOWN seconds instead of paying its full timeout on
+    # every request during an outage. After the cooldown one probe attempt
+    # is let through; another failure re-opens the circuit immediately, and
+    # each successive re-open doubles the cooldown up to CB_MAX_COOLDOWN so
+    # a provider that stays down is probed progressively less often.
+    CB_THRESHOLD = 5
+    CB_COOLDOWN = 30.0
+    CB_MAX_COOLDOWN = 300.0
+
+    # Below this many prompts the Batch API's scheduling overhead outweighs
+    # its per-token discount; smaller jobs go through call_llm_many.
+    BATCH_MIN_PROMPTS = 16
+
     def __init__(
         self,
         openai_key: Optional[str] = None,
@@ -59,8 +111,27 @@ class LLMClient:
     ) -> None:
         self.rate_limit = max(rate_limit, 0.0)
         self._rate_limit_lock = threading.Lock()
-        self._last_llm_call_time = time.monotonic() - self.rate_limit
+        # Monotonic deadline per provider: each provider is paced
+        # independently, so threads falling back to different providers
+        # never queue behind one shared interval.
+        self._next_allowed_at: Dict[str, float] = {}
+        self._cb_lock = threading.Lock()
+        self._cb_failures: Dict[str, int] = {}
+        self._cb_opened_at: Dict[str, float] = {}
+        self._cb_reopens: Dict[str, int] = {}
         self.system_prompt = system_prompt
+        # The system prompt never changes after init, so the per-provider
+        # system message objects are built once instead of per call; only
+        # the user message is allocated per request.
+        self._openai_system_message = {"role": "system", "content": system_prompt}
+        self._anthropic_system_blocks = [
+            {
+                "type": "text",
+                "text": system_prompt,
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
+        self._mistral_system_message: Optional[Any] = None  # built on first Mistral call
 
         self.openai_key = (openai_key or "").strip()
         self.anthropic_key = (anthropic_key or "").strip()
@@ -73,9 +144,27 @@ class LLMClient:
         order = self._normalise_provider_order(provider_order)
         self._providers = self._build_provider_registry(order)
 
-        if not self._providers:
+        if not self._provider_names:
             logger.warning("LLMClient initialized without any available providers.")
 
+    # Providers are stored as two parallel tuples (names and callables) so
+    # the hot failover loop indexes flat arrays instead of unpacking a tuple
+    # per step; the _providers property keeps the list-of-pairs interface.
+    @property
+    def _providers(self) -> List[tuple[str, Callable[[str, str, float, int], str]]]:
+        return list(zip(self._provider_names, self._provider_calls))
+
+    @_providers.setter
+    def _providers(
+        self, entries: Sequence[tuple[str, Callable[[str, str, float, int], str]]]
+    ) -> None:
+        if entries:
+            names, calls = zip(*entries)
+        else:
+            names, calls = (), ()
+        self._provider_names = tuple(names)
+        self._provider_calls = tuple(calls)
+
     @classmethod
     def from_config(cls, config: Dict[str, Any]) -> "LLMClient":
         """Instantiate the client using a configuration dictionary."""
@@ -101,39 +190,115 @@ class LLMClient:
             if not value:
                 continue
             normalised = name.lower()
-            if normalised in _SUPPORTED_PROVIDERS:
+            if normalised in _SUPPORTED_PROVIDER_SET:
                 provider_models[normalised] = value
         return provider_models
 
+    @staticmethod
+    def _build_http_client() -> Optional[Any]:
+        """Build one keep-alive connection pool to share across provider SDKs.
+
+        Without this the SDKs each manage their own transport; pooling keeps a
+        warm connection per provider so sequential calls in a knowledge round
+        skip the ~100-200 ms TLS handshake. HTTP/2 is used when the ``h2``
+        extra is installed, falling back to pooled HTTP/1.1 otherwise.
+        """
+        try:  # pragma: no cover - optional dependency
+            import httpx
+        except ImportError:  # pragma: no cover - handled gracefully
+            return None
+        limits = httpx.Limits(max_keepalive_connections=10, max_connections=20)
+        try:
+            return httpx.Client(http2=True, timeout=60, limits=limits)
+        except ImportError:
+            return httpx.Client(timeout=60, limits=limits)
+
     def _initialise_clients(self) -> None:
-        self.openai_client = self._build_client(self.openai_key, OpenAI, "OpenAI")
-        self.anthropic_client = self._build_client(self.anthropic_key, Anthropic, "Anthropic")
-        self.mistral_client = self._build_client(self.mistral_key, MistralClient, "Mistral")
+        http_client = None
+        if self.openai_key or self.anthropic_key:
+            http_client = self._build_http_client()
+        self._http_client = http_client
+        self.openai_client = self._build_client(
+            self.openai_key, "openai", "OpenAI", http_client=http_client
+        )
+        self.anthropic_client = self._build_client(
+            self.anthropic_key, "anthropic", "Anthropic", http_client=http_client
+        )
+        # The Mistral SDK manages its own transport and does not accept an
+        # injected client.
+        self.mistral_client = self._build_client(self.mistral_key, "mistral", "Mistral")
 
 
     def _build_provider_registry(
         self, order: Sequence[str]
     ) -> List[tuple[str, Callable[[str, str, float, int], str]]]:
-        return [
-            (name, call_fn)
-            for name in order
-            if (
-                getattr(self, f"{name}_client", None) is not None
-                and callable(call_fn := getattr(self, f"_call_{name}", None))
-            )
-        ]
-
-    def _apply_rate_limit(self) -> None:
+        # Bound methods resolved directly rather than through f-string
+        # getattr reflection; the registry holds the callables themselves,
+        # so the call path never pays an attribute lookup per request.
+        wrappers: Dict[str, tuple[Any, Callable[[str, str, float, int], str]]] = {
+            "openai": (self.openai_client, self._call_openai),
+            "anthropic": (self.anthropic_client, self._call_anthropic),
+            "mistral": (self.mistral_client, self._call_mistral),
+        }
+        registry = []
+        for name in order:
+            client, call_fn = wrappers.get(name, (None, None))
+            if client is not None:
+                registry.append((name, call_fn))
+        return registry
+
+    def _apply_rate_limit(self, provider: str) -> None:
         if self.rate_limit <= 0:
             return
+        # Reserve the next slot under the lock, then sleep outside it so
+        # other threads can reserve their own slots concurrently.
         with self._rate_limit_lock:
             now = time.monotonic()
-            wait_time = self.rate_limit - (now - self._last_llm_call_time)
-            if wait_time > 0:
-                logger.debug("LLM rate limiting: sleeping %.2fs", wait_time)
-                time.sleep(wait_time)
-                now = time.monotonic()
-            self._last_llm_call_time = now
+            next_allowed = self._next_allowed_at.get(provider, now)
+            wait_time = next_allowed - now
+            self._next_allowed_at[provider] = max(next_allowed, now) + self.rate_limit
+        if wait_time > 0:
+            logger.debug("LLM rate limiting (%s): sleeping %.2fs", provider, wait_time)
+            time.sleep(wait_time)
+
+    def _circuit_open(self, provider: str) -> bool:
+        with self._cb_lock:
+            opened_at = self._cb_opened_at.get(provider)
+            if opened_at is None:
+                return False
+            cooldown = min(
+                self.CB_COOLDOWN * (2 ** self._cb_reopens.get(provider, 0)),
+                self.CB_MAX_COOLDOWN,
+            )
+            if time.monotonic() - opened_at >= cooldown:
+                # Half-open: allow a probe; one more failure re-opens.
+                del self._cb_opened_at[provider]
+                self._cb_failures[provider] = self.CB_THRESHOLD - 1
+                return False
+            return True
+
+    def _record_success(self, provider: str) -> None:
+        with self._cb_lock:
+            self._cb_failures.pop(provider, None)
+            self._cb_opened_at.pop(provider, None)
+            self._cb_reopens.pop(provider, None)
+
+    def _record_failure(self, provider: str) -> None:
+        with self._cb_lock:
+            count = self._cb_failures.get(provider, 0) + 1
+            self._cb_failures[provider] = count
+            if count >= self.CB_THRESHOLD:
+                logger.warning(
+                    "Circuit opened for LLM provider %s after %d consecutive failures.",
+                    provider,
+                    count,
+                )
+                if provider in self._cb_reopens:
+                    # Failed half-open probe: back off further before the next one.
+                    self._cb_reopens[provider] += 1
+                else:
+                    self._cb_reopens[provider] = 0
+                self._cb_opened_at[provider] = time.monotonic()
 
     @staticmethod
     def _normalise_provider_order(provider_order: Optional[Sequence[str]] | Optional[str]) -> List[str]:
@@ -149,7 +314,7 @@ class LLMClient:
             name = candidate.strip().lower()
             if not name:
                 continue
-            if name not in _SUPPORTED_PROVIDERS:
+            if name not in _SUPPORTED_PROVIDER_SET:
                 logger.warning("Ignoring unsupported LLM provider '%s' in configuration.", candidate)
                 continue
             if name not in order:
@@ -162,10 +327,25 @@ class LLMClient:
         )
         return list(_DEFAULT_PROVIDER_ORDER)
 
-    def _build_client(self, key: str, cls: Any, provider_name: str) -> Optional[Any]:
-        if not key or cls is None:
+    def _build_client(
+        self,
+        key: str,
+        sdk_name: str,
+        provider_name: str,
+        http_client: Optional[Any] = None,
+    ) -> Optional[Any]:
+        if not key:
+            return None
+        cls = _resolve_sdk(sdk_name)
+        if cls is None:
             return None
         try:
+            if http_client is not None:
+                try:
+                    return cls(api_key=key, http_client=http_client)
+                except TypeError:
+                    # SDK version without http_client injection support
+                    pass
             return cls(api_key=key)
         except Exception as exc:  # pragma: no cover - network failures
             logger.error("Failed to initialize %s client: %s", provider_name, exc)
@@ -178,44 +358,493 @@ class LLMClient:
         temperature: float = 0.7,
         max_tokens: int = 512,
         model_overrides: Optional[Dict[str, str]] = None,
+        hedge_delay: Optional[float] = None,
     ) -> str:
-        """Call the first available provider and return its response text."""
+        """Call the first available provider and return its response text.
+
+        With ``hedge_delay`` set, a fallback provider is raced in parallel
+        whenever the current attempt hasn't answered within that many
+        seconds, and the first success wins; the default remains strictly
+        sequential fallback.
+        """
 
-        if not self._providers:
+        provider_names = self._provider_names
+        provider_calls = self._provider_calls
+        if not provider_names:
             logger.error("No LLM providers are configured or available.")
             return "LLM Error: No providers are configured."
 
-        provider_models = dict(self._provider_models)
-        if model:
-            provider_models["openai"] = model
-        if model_overrides:
-            for name, override in model_overrides.items():
-                if not override:
-                    continue
-                provider_models[name.lower()] = override
-
-        error_messages: List[str] = []
-        for provider, call_fn in self._providers:
-            self._apply_rate_limit()
+        # Only copy the model map when this call actually overrides it; the
+        # common no-override case reads the (never mutated) init-time dict.
+        if model or model_overrides:
+            provider_models = dict(self._provider_models)
+            if model:
+                provider_models["openai"] = model
+            if model_overrides:
+                provider_models.update(
+                    {
+                        name.lower(): override
+                        for name, override in model_overrides.items()
+                        if override
+                    }
+                )
+        else:
+            provider_models = self._provider_models
+
+        cache_key = None
+        if temperature <= 0:
+            fingerprint = "|".join(
+                (
+                    self.system_prompt,
+                    prompt,
+                    str(temperature),
+                    str(max_tokens),
+                    repr(sorted(provider_models.items())),
+                )
+            )
+            cache_key = (
+                "llm_response_"
+                + hashlib.blake2b(fingerprint.encode("utf-8"), digest_size=16).hexdigest()
+            )
+            cached = _get_response_cache().get(cache_key, max_age=_RESPONSE_CACHE_MAX_AGE)
+            if cached is not None:
+                logger.debug("LLM response cache hit.")
+                return cached
+
+        if hedge_delay is not None and len(provider_names) > 1:
+            result = self._call_llm_hedged(
+                prompt, provider_models, temperature, max_tokens, hedge_delay
+            )
+            if cache_key and not result.startswith("LLM Error"):
+                _get_response_cache().set(cache_key, result)
+            return result
+
+        # Allocated lazily, holding raw (provider, exception-or-None) pairs:
+        # the success path never touches an error list, and message strings
+        # are only formatted if every provider ends up failing. A None
+        # exception marks a circuit-open skip.
+        error_records: Optional[List[tuple[str, Optional[Exception]]]] = None
+        for index in range(len(provider_names)):
+            provider = provider_names[index]
+            call_fn = provider_calls[index]
+            if self._circuit_open(provider):
+                logger.warning("LLM provider %s skipped: circuit open", provider)
+                error_records = error_records or []
+                error_records.append((provider, None))
+                continue
+            self._apply_rate_limit(provider)
             try:
                 provider_model = provider_models.get(provider) or model or ""
                 response = call_fn(prompt, provider_model, temperature, max_tokens)
-                return (response or "").strip()
+                self._record_success(provider)
+                result = (response or "").strip()
+                if cache_key:
+                    _get_response_cache().set(cache_key, result)
+                return result
+            except Exception as exc:
+                self._record_failure(provider)
+                logger.error("LLM provider %s failed: %s", provider, exc)
+                error_records = error_records or []
+                error_records.append((provider, exc))
+
+        if error_records:
+            aggregated_errors = "\n".join(
+                f"LLM provider {provider} skipped: circuit open"
+                if exc is None
+                else f"LLM provider {provider} failed: {exc}"
+                for provider, exc in error_records
+            )
+            logger.error(
+                "All LLM providers failed to respond. Errors:\n%s", aggregated_errors
+            )
+            return (
+                "LLM Error: Unable to process the request.\nDetails:\n" + aggregated_errors
+            )
+        logger.error("All LLM providers failed to respond.")
+        return "LLM Error: Unable to process the request."
+
+    async def acall_llm(self, prompt: str, **call_kwargs: Any) -> str:
+        """Async twin of :meth:`call_llm` for event-loop callers.
+
+        The provider wrappers are synchronous SDK calls, so each request is
+        pushed onto a worker thread; awaiting several of these under
+        asyncio.gather overlaps their network waits on one loop instead of
+        serializing full round trips.
+        """
+
+        return await asyncio.to_thread(self.call_llm, prompt, **call_kwargs)
+
+    async def acall_llm_many(
+        self,
+        prompts: Sequence[str],
+        concurrency: int = 10,
+        **call_kwargs: Any,
+    ) -> List[str]:
+        """Async batch variant of :meth:`call_llm_many`, preserving order."""
+
+        prompts = list(prompts)
+        if not prompts:
+            return []
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def bounded(prompt: str) -> str:
+            async with semaphore:
+                return await self.acall_llm(prompt, **call_kwargs)
+
+        return list(await asyncio.gather(*(bounded(prompt) for prompt in prompts)))
+
+    def call_llm_many(
+        self,
+        prompts: Sequence[str],
+        concurrency: int = 10,
+        **call_kwargs: Any,
+    ) -> List[str]:
+        """Answer a batch of prompts in parallel, preserving input order.
+
+        Pipelines that summarize or score N items at ~2-5s per round trip
+        get near-linear speedup up to the provider's concurrency limit.
+        The per-provider rate limiter and circuit breaker still apply to
+        every underlying call; extra keyword arguments are forwarded to
+        :meth:`call_llm`.
+        """
+
+        prompts = list(prompts)
+        if not prompts:
+            return []
+        if len(prompts) == 1:
+            return [self.call_llm(prompts[0], **call_kwargs)]
+
+        max_workers = max(1, min(concurrency, len(prompts)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(lambda prompt: self.call_llm(prompt, **call_kwargs), prompts)
+            )
+
+    def call_llm_batch(
+        self,
+        prompts: Sequence[str],
+        interactive: bool = True,
+        temperature: float = 0.7,
+        max_tokens: int = 512,
+        poll_interval: float = 30.0,
+        **call_kwargs: Any,
+    ) -> List[str]:
+        """Answer a batch of prompts, preserving input order.
+
+        Interactive callers get :meth:`call_llm_many`'s parallel fan-out.
+        With ``interactive=False`` and at least ``BATCH_MIN_PROMPTS``
+        prompts, the job is submitted to OpenAI's Batch API instead: half
+        the per-token price and no per-request rate limiting, in exchange
+        for minutes-to-hours of latency. Deep-dive rounds with no latency
+        SLA are the intended caller. Falls back to :meth:`call_llm_many`
+        if the batch cannot be submitted or fails.
+        """
+
+        prompts = list(prompts)
+        if not prompts:
+            return []
+        if (
+            interactive
+            or len(prompts) < self.BATCH_MIN_PROMPTS
+            or self.openai_client is None
+        ):
+            return self.call_llm_many(
+                prompts, temperature=temperature, max_tokens=max_tokens, **call_kwargs
+            )
+        try:
+            return self._call_openai_batch(prompts, temperature, max_tokens, poll_interval)
+        except Exception as exc:
+            logger.error("OpenAI batch job failed (%s); falling back to parallel calls.", exc)
+            return self.call_llm_many(
+                prompts, temperature=temperature, max_tokens=max_tokens, **call_kwargs
+            )
+
+    def _call_openai_batch(
+        self,
+        prompts: List[str],
+        temperature: float,
+        max_tokens: int,
+        poll_interval: float,
+    ) -> List[str]:
+        model = self._provider_models.get("openai", "")
+        lines = []
+        for index, prompt in enumerate(prompts):
+            lines.append(
+                json.dumps(
+                    {
+                        "custom_id": str(index),
+                        "method": "POST",
+                        "url": "/v1/chat/completions",
+                        "body": {
+                            "model": model,
+                            "messages": [
+                                {"role": "system", "content": self.system_prompt},
+                                {"role": "user", "content": prompt},
+                            ],
+                            "temperature": temperature,
+                            "max_tokens": max_tokens,
+                        },
+                    }
+                )
+            )
+        payload = io.BytesIO("\n".join(lines).encode("utf-8"))
+        payload.name = "kallisto_batch.jsonl"
+
+        input_file = self.openai_client.files.create(file=payload, purpose="batch")
+        batch = self.openai_client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        logger.info("OpenAI batch %s submitted with %d prompts.", batch.id, len(prompts))
+
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            time.sleep(poll_interval)
+            batch = self.openai_client.batches.retrieve(batch.id)
+        if batch.status != "completed":
+            raise RuntimeError(f"batch {batch.id} ended with status {batch.status}")
+
+        output = self.openai_client.files.content(batch.output_file_id)
+        results: List[str] = ["LLM Error: missing batch result."] * len(prompts)
+        for line in output.text.splitlines():
+            if not line:
+                continue
+            record = json.loads(line)
+            index = int(record["custom_id"])
+            body = (record.get("response") or {}).get("body") or {}
+            choices = body.get("choices")
+            if choices:
+                results[index] = (choices[0]["message"]["content"] or "").strip()
+        return results
+
+    def call_llm_stream(
+        self,
+        prompt: str,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 512,
+        model_overrides: Optional[Dict[str, str]] = None,
+    ) -> Iterator[str]:
+        """Stream the response from the first available provider.
+
+        Yields content deltas as the provider emits them, so callers see
+        the first tokens after TTFT instead of waiting for the complete
+        response. Provider fallback happens before the first delta is
+        yielded; once a stream has started it is committed. Providers
+        without a streaming wrapper are served as a single chunk. The
+        response cache does not apply here — use :meth:`call_llm` for
+        cacheable deterministic calls.
+        """
+
+        provider_names = self._provider_names
+        provider_calls = self._provider_calls
+        if not provider_names:
+            logger.error("No LLM providers are configured or available.")
+            return iter(("LLM Error: No providers are configured.",))
+
+        if model or model_overrides:
+            provider_models = dict(self._provider_models)
+            if model:
+                provider_models["openai"] = model
+            if model_overrides:
+                provider_models.update(
+                    {
+                        name.lower(): override
+                        for name, override in model_overrides.items()
+                        if override
+                    }
+                )
+        else:
+            provider_models = self._provider_models
+
+        stream_fns: Dict[str, Callable[..., Iterator[str]]] = {
+            "openai": self._stream_openai,
+            "anthropic": self._stream_anthropic,
+        }
+
+        error_messages: Optional[List[str]] = None
+        for index in range(len(provider_names)):
+            provider = provider_names[index]
+            if self._circuit_open(provider):
+                error_msg = f"LLM provider {provider} skipped: circuit open"
+                logger.warning(error_msg)
+                error_messages = error_messages or []
+                error_messages.append(error_msg)
+                continue
+            self._apply_rate_limit(provider)
+            provider_model = provider_models.get(provider) or model or ""
+            stream_fn = stream_fns.get(provider)
+            try:
+                if stream_fn is not None:
+                    deltas = stream_fn(prompt, provider_model, temperature, max_tokens)
+                    # Probe for the first delta eagerly so connection and
+                    # auth failures still fall through to the next provider.
+                    first = next(deltas, None)
+                else:
+                    response = provider_calls[index](
+                        prompt, provider_model, temperature, max_tokens
+                    )
+                    deltas = iter(())
+                    first = (response or "").strip()
             except Exception as exc:
+                self._record_failure(provider)
                 error_msg = f"LLM provider {provider} failed: {exc}"
                 logger.error(error_msg)
+                error_messages = error_messages or []
                 error_messages.append(error_msg)
+                continue
+            self._record_success(provider)
 
-        aggregated_errors = "\n".join(error_messages)
-        if aggregated_errors:
+            def emit(head: Optional[str], tail: Iterator[str]) -> Iterator[str]:
+                if head:
+                    yield head
+                yield from tail
+
+            return emit(first, deltas)
+
+        if error_messages:
+            aggregated_errors = "\n".join(error_messages)
             logger.error(
                 "All LLM providers failed to respond. Errors:\n%s", aggregated_errors
             )
-            return (
-                "LLM Error: Unable to process the request.\nDetails:\n" + aggregated_errors
+            return iter(
+                ("LLM Error: Unable to process the request.\nDetails:\n" + aggregated_errors,)
             )
         logger.error("All LLM providers failed to respond.")
-        return "LLM Error: Unable to process the request."
+        return iter(("LLM Error: Unable to process the request.",))
+
+    def _stream_openai(
+        self,
+        prompt: str,
+        model: str,
+        temperature: float,
+        max_tokens: int,
+    ) -> Iterator[str]:
+        if self.openai_client is None:
+            raise RuntimeError("OpenAI client is not configured")
+
+        logger.debug("LLMClient(OpenAI): Streaming model %s", model)
+        response = self.openai_client.chat.completions.create(
+            model=model,
+            messages=[
+                self._openai_system_message,
+                {"role": "user", "content": prompt},
+            ],
+            temperature=temperature,
+            max_tokens=max_tokens,
+            n=1,
+            stream=True,
+        )
+        for chunk in response:
+            choices = getattr(chunk, "choices", None)
+            if not choices:
+                continue
+            delta = getattr(choices[0].delta, "content", None)
+            if delta:
+                yield delta
+
+    def _stream_anthropic(
+        self,
+        prompt: str,
+        model: str,
+        temperature: float,
+        max_tokens: int,
+    ) -> Iterator[str]:
+        if self.anthropic_client is None:
+            raise RuntimeError("Anthropic client is not configured")
+
+        logger.debug("LLMClient(Anthropic): Streaming model %s", model)
+        with self.anthropic_client.messages.stream(
+            model=model,
+            system=self._anthropic_system_blocks,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            messages=[{"role": "user", "content": prompt}],
+        ) as stream:
+            for text in stream.text_stream:
+                if text:
+                    yield text
+
+    def _call_llm_hedged(
+        self,
+        prompt: str,
+        provider_models: Dict[str, str],
+        temperature: float,
+        max_tokens: int,
+        hedge_delay: float,
+    ) -> str:
+        """Race providers with a staggered start and return the first success.
+
+        The primary is fired immediately; each time ``hedge_delay`` elapses
+        without an answer (or an attempt fails outright), the next provider
+        in the fallback order joins the race. A slow-but-healthy primary
+        therefore caps tail latency at roughly ``hedge_delay`` plus the
+        fastest fallback's latency instead of the primary's full timeout.
+        """
+
+        def invoke(provider: str, call_fn: Callable[[str, str, float, int], str]) -> str:
+            self._apply_rate_limit(provider)
+            provider_model = provider_models.get(provider) or ""
+            try:
+                response = call_fn(prompt, provider_model, temperature, max_tokens)
+            except Exception:
+                self._record_failure(provider)
+                raise
+            self._record_success(provider)
+            return (response or "").strip()
+
+        providers = [
+            entry for entry in self._providers if not self._circuit_open(entry[0])
+        ]
+        if not providers:
+            logger.error("All LLM provider circuits are open.")
+            return "LLM Error: Unable to process the request.\nDetails:\nAll provider circuits are open."
+        if len(providers) == 1:
+            try:
+                return invoke(*providers[0])
+            except Exception as exc:
+                error_msg = f"LLM provider {providers[0][0]} failed: {exc}"
+                logger.error(error_msg)
+                return "LLM Error: Unable to process the request.\nDetails:\n" + error_msg
+        error_messages: List[str] = []
+        executor = ThreadPoolExecutor(max_workers=len(providers))
+        try:
+            pending: Dict[Any, str] = {
+                executor.submit(invoke, *providers[0]): providers[0][0]
+            }
+            next_index = 1
+            while pending:
+                timeout = hedge_delay if next_index < len(providers) else None
+                done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                failed = False
+                for future in done:
+                    provider = pending.pop(future)
+                    try:
+                        return future.result()
+                    except Exception as exc:
+                        error_msg = f"LLM provider {provider} failed: {exc}"
+                        logger.error(error_msg)
+                        error_messages.append(error_msg)
+                        failed = True
+                # Hedge: fire the next provider when the timer lapses with
+                # no answer, or immediately after a failure.
+                if next_index < len(providers) and (not done or failed):
+                    pending[executor.submit(invoke, *providers[next_index])] = providers[
+                        next_index
+                    ][0]
+                    next_index += 1
+        finally:
+            # Don't wait for losing attempts to drain; their threads finish
+            # in the background.
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        aggregated_errors = "\n".join(error_messages)
+        logger.error(
+            "All LLM providers failed to respond. Errors:\n%s", aggregated_errors
+        )
+        return (
+            "LLM Error: Unable to process the request.\nDetails:\n" + aggregated_errors
+        )
 
     def _call_openai(
         self,
@@ -231,7 +860,7 @@ class LLMClient:
         response = self.openai_client.chat.completions.create(
             model=model,
             messages=[
-                {"role": "system", "content": self.system_prompt},
+                self._openai_system_message,
                 {"role": "user", "content": prompt},
             ],
             temperature=temperature,
@@ -254,17 +883,26 @@ class LLMClient:
             raise RuntimeError("Anthropic client is not configured")
 
         logger.debug("LLMClient(Anthropic): Calling model %s", model)
+        # cache_control marks the (identical across calls) system prompt as a
+        # reusable prefix, so Anthropic serves its KV from cache and bills/
+        # times only the per-request suffix.
         response = self.anthropic_client.messages.create(
             model=model,
-            system=self.system_prompt,
+            system=self._anthropic_system_blocks,
             max_tokens=max_tokens,
             temperature=temperature,
             messages=[{"role": "user", "content": prompt}],
         )
         if not response.content:
             return ""
-        # The content is a list of blocks; concatenate text blocks
-        return "".join(block.text for block in response.content if hasattr(block, "text"))
+        # The content is a list of blocks; concatenate text blocks. Checking
+        # the block's type field is cheaper than hasattr's swallowed
+        # AttributeError on non-text blocks.
+        return "".join(
+            _get_block_text(block)
+            for block in response.content
+            if getattr(block, "type", None) == "text"
+        )
 
     def _call_mistral(
         self,
@@ -273,14 +911,19 @@ class LLMClient:
         temperature: float,
         max_tokens: int,
     ) -> str:
+        ChatMessage = _resolve_sdk("mistral_chat_message")
         if self.mistral_client is None or ChatMessage is None:
             raise RuntimeError("Mistral client is not configured")
 
         logger.debug("LLMClient(Mistral): Calling model %s", model)
+        if self._mistral_system_message is None:
+            self._mistral_system_message = ChatMessage(
+                role="system", content=self.system_prompt
+            )
         response = self.mistral_client.chat(
             model=model,
             messages=[
-                ChatMessage(role="system", content=self.system_prompt),
+                self._mistral_system_message,
                 ChatMessage(role="user", content=prompt),
             ],
             temperature=temperature,
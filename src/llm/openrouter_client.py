@@ -1,9 +1,24 @@
 """OpenRouter LLM client for Guardr"""
 
 from typing import Dict, Any, List, Optional
+import json
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
 from src.utils.logger import get_logger
 
+try:  # optional - faster (de)serialization for completion payloads
+    import orjson
+except ImportError:
+    orjson = None
+
+try:  # optional - HTTP/2 multiplexed transport for completions
+    import httpx
+except ImportError:
+    httpx = None
+
 logger = get_logger(__name__)
 
 
@@ -28,6 +43,55 @@ class OpenRouterClient:
         self.timeout = timeout
         self.default_model = default_model
 
+        # Persistent session: plain requests.post opens a new TCP+TLS
+        # connection (~100ms handshake) per completion. Pooled keep-alive
+        # sockets plus transport-level retries on transient statuses.
+        self._session = requests.Session()
+        self._session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=16,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.5,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                    allowed_methods=["POST"],
+                ),
+            ),
+        )
+        self._session.headers.update({
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        })
+
+        # When httpx is installed, completions go over one keep-alive
+        # httpx client (HTTP/2 when the h2 extra is present) so concurrent
+        # calls multiplex a single connection instead of queuing on
+        # per-request sockets. Streaming stays on the requests session.
+        self._http = None
+        if httpx is not None:
+            limits = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+            headers = {
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json",
+            }
+            try:
+                self._http = httpx.Client(
+                    http2=True,
+                    base_url=self.base_url,
+                    timeout=timeout,
+                    limits=limits,
+                    headers=headers,
+                )
+            except ImportError:
+                self._http = httpx.Client(
+                    base_url=self.base_url,
+                    timeout=timeout,
+                    limits=limits,
+                    headers=headers,
+                )
+
     def chat_completion(
         self,
         prompt: str,
@@ -47,19 +111,106 @@ class OpenRouterClient:
             model: Model to use (defaults to o3-mini)
             temperature: Sampling temperature
             max_tokens: Max output tokens
-            stream: Enable streaming (not implemented)
+            stream: Stream the completion and join the deltas
             provider_config: OpenRouter provider preferences
 
         Returns:
             Response text
         """
-        model = model or self.default_model
+        if stream:
+            return "".join(
+                self.chat_completion_stream(
+                    prompt,
+                    system_prompt=system_prompt,
+                    model=model,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    provider_config=provider_config,
+                )
+            ).strip()
+
+        payload = self._build_payload(
+            prompt, system_prompt, model, temperature, max_tokens, provider_config
+        )
+
+        # orjson serializes the payload and decodes the response straight
+        # from bytes, skipping requests' charset indirection; completion
+        # bodies are often tens of KB.
+        if orjson is not None:
+            body = orjson.dumps(payload)
+        else:
+            body = json.dumps(payload).encode("utf-8")
 
-        messages = [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": prompt}
-        ]
+        if self._http is not None:
+            try:
+                response = self._http.post("/chat/completions", content=body)
+                response.raise_for_status()
+            except httpx.HTTPStatusError as e:
+                raise RuntimeError(
+                    f"OpenRouter HTTP {e.response.status_code}: {e.response.text}"
+                ) from e
+            except httpx.TimeoutException as e:
+                raise RuntimeError(
+                    f"OpenRouter request timed out after {self.timeout}s"
+                ) from e
+            except Exception as e:
+                raise RuntimeError(f"OpenRouter request failed: {e}") from e
+            data = orjson.loads(response.content) if orjson is not None else response.json()
+        else:
+            try:
+                response = self._session.post(
+                    f"{self.base_url}/chat/completions",
+                    data=body,
+                    timeout=self.timeout,
+                )
 
+                response.raise_for_status()
+                if orjson is not None:
+                    data = orjson.loads(response.content)
+                else:
+                    data = response.json()
+
+            except requests.exceptions.HTTPError as e:
+                status = response.status_code
+                error_text = response.text if response else "unknown"
+                raise RuntimeError(f"OpenRouter HTTP {status}: {error_text}") from e
+
+            except requests.exceptions.Timeout as e:
+                raise RuntimeError(f"OpenRouter request timed out after {self.timeout}s") from e
+
+            except Exception as e:
+                raise RuntimeError(f"OpenRouter request failed: {e}") from e
+
+        # Surface server-reported errors before touching choices, and
+        # fast-return on an empty choices list rather than raising through
+        # the extraction path.
+        error = data.get("error")
+        if error is not None:
+            raise RuntimeError(f"OpenRouter error: {error}")
+
+        choices = data.get("choices")
+        if not choices:
+            return ""
+
+        content = choices[0]["message"]["content"]
+        if isinstance(content, list):
+            # Rare provider shape: content as a list of text parts. The
+            # plain-string fast path above stays allocation-free.
+            content = "".join(
+                part if isinstance(part, str) else str(part) for part in content
+            )
+        return content.strip()
+
+    def _build_payload(
+        self,
+        prompt: str,
+        system_prompt: str,
+        model: Optional[str],
+        temperature: float,
+        max_tokens: int,
+        provider_config: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Assemble the chat-completion request payload"""
         # Default provider config from your curl example
         if provider_config is None:
             provider_config = {
@@ -69,43 +220,79 @@ class OpenRouterClient:
                 "order": ["OpenAI", "Together", "Anthropic"],
             }
 
-        payload = {
-            "model": model,
-            "messages": messages,
+        return {
+            "model": model or self.default_model,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt}
+            ],
             "temperature": temperature,
             "max_tokens": max_tokens,
             "provider": provider_config,
         }
 
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
+    def chat_completion_stream(
+        self,
+        prompt: str,
+        system_prompt: str = "You are a helpful assistant.",
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 4000,
+        provider_config: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Stream a chat completion, yielding content deltas as they arrive
+
+        The first token is available as soon as the server emits it instead
+        of after the full body downloads, and the whole JSON response is
+        never buffered in memory.
+        """
+        payload = self._build_payload(
+            prompt, system_prompt, model, temperature, max_tokens, provider_config
+        )
+        payload["stream"] = True
+
+        if orjson is not None:
+            body = orjson.dumps(payload)
+        else:
+            body = json.dumps(payload).encode("utf-8")
 
         try:
-            response = requests.post(
+            response = self._session.post(
                 f"{self.base_url}/chat/completions",
-                headers=headers,
-                json=payload,
+                data=body,
                 timeout=self.timeout,
+                stream=True,
             )
-
             response.raise_for_status()
-            data = response.json()
-
-            content = data["choices"][0]["message"]["content"]
-            return content.strip()
-
         except requests.exceptions.HTTPError as e:
-            status = response.status_code
-            error_text = response.text if response else "unknown"
-            raise RuntimeError(f"OpenRouter HTTP {status}: {error_text}") from e
-
+            raise RuntimeError(
+                f"OpenRouter HTTP {response.status_code}: {response.text}"
+            ) from e
         except requests.exceptions.Timeout as e:
             raise RuntimeError(f"OpenRouter request timed out after {self.timeout}s") from e
-
         except Exception as e:
             raise RuntimeError(f"OpenRouter request failed: {e}") from e
 
+        loads = orjson.loads if orjson is not None else json.loads
+        with response:
+            for line in response.iter_lines():
+                if not line or not line.startswith(b"data: "):
+                    continue
+                chunk = line[len(b"data: "):]
+                if chunk == b"[DONE]":
+                    break
+                try:
+                    data = loads(chunk)
+                except ValueError:
+                    logger.warning("Skipping malformed SSE chunk from OpenRouter")
+                    continue
+                choices = data.get("choices")
+                if not choices:
+                    continue
+                delta = choices[0].get("delta", {}).get("content")
+                if delta:
+                    yield delta
+
 
 __all__ = ["OpenRouterClient"]
@@ -0,0 +1,196 @@
+"""
+Semantic Cache module.
+Caches LLM responses keyed on the meaning of the query rather than its exact
+text, so near-duplicate lookups (whitespace, casing, small rewordings) reuse
+an earlier answer instead of triggering a fresh search + LLM round trip.
+"""
+
+import re
+import threading
+from time import time
+
+from src.utils.logger import get_logger
+
+try:  # optional - vectorized similarity search for embedding mode
+    import numpy as np
+except ImportError:
+    np = None
+
+try:  # optional - SIMD-accelerated inner-product index
+    import faiss
+except ImportError:
+    faiss = None
+
+logger = get_logger(__name__)
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def _tokenize(text):
+    """Normalize text into a set of lowercase word tokens, ignoring punctuation."""
+    return frozenset(_TOKEN_PATTERN.findall(text.lower()))
+
+
+def _jaccard_similarity(tokens_a, tokens_b):
+    """Jaccard similarity between two token sets (0.0 - 1.0)."""
+    if not tokens_a or not tokens_b:
+        return 0.0
+    intersection = len(tokens_a & tokens_b)
+    if not intersection:
+        return 0.0
+    return intersection / len(tokens_a | tokens_b)
+
+
+def _cosine_similarity(vec_a, vec_b):
+    """Dot product of two embedder-normalized vectors (0.0 - 1.0)."""
+    return float(sum(a * b for a, b in zip(vec_a, vec_b)))
+
+
+def default_embedder(model_name="sentence-transformers/all-MiniLM-L6-v2"):
+    """
+    Returns a local sentence-embedding callable for SemanticCache, or None
+    when the optional sentence-transformers dependency is not installed.
+
+    Embeddings catch rewordings that share few literal tokens ("tell me
+    about X" vs "what do you know about X"), which the token-set fallback
+    misses. The model loads once, on first call to this factory.
+    """
+    try:
+        from sentence_transformers import SentenceTransformer
+    except ImportError:
+        return None
+
+    model = SentenceTransformer(model_name)
+
+    def embed(text):
+        return model.encode([text], normalize_embeddings=True)[0]
+
+    return embed
+
+
+class SemanticCache:
+    """
+    In-memory cache matching queries by semantic similarity.
+
+    Exact matches are served from a dict; otherwise entries are scanned for
+    the closest match above ``similarity_threshold``. Similarity defaults to
+    token-set Jaccard; pass an ``embedder`` callable (text -> normalized
+    vector, e.g. :func:`default_embedder`) to compare by embedding cosine
+    instead; with faiss installed, embedding lookups run through a SIMD
+    inner-product index rather than a Python loop. Entries expire after
+    ``max_age`` seconds and the store is bounded to ``max_entries``
+    (oldest evicted first).
+    """
+
+    def __init__(self, similarity_threshold=0.9, max_age=3600, max_entries=256, embedder=None):
+        self.similarity_threshold = similarity_threshold
+        self.max_age = max_age
+        self.max_entries = max_entries
+        self._embedder = embedder
+        self._represent = embedder if embedder is not None else _tokenize
+        self._similarity = _cosine_similarity if embedder is not None else _jaccard_similarity
+        self._lock = threading.Lock()
+        self._exact = {}
+        self._entries = []  # list of (representation, key, value, timestamp)
+        # FAISS inner-product index over the stored embeddings: one SIMD
+        # search instead of a Python loop per lookup. Rebuilt lazily after
+        # evictions; plain scan remains the fallback.
+        self._use_faiss = faiss is not None and np is not None and embedder is not None
+        self._index = None
+        self._index_stale = False
+
+    def get(self, query):
+        """
+        Returns the cached response for a semantically similar query,
+        or None on a miss.
+        """
+        now = time()
+        with self._lock:
+            self._evict_expired(now)
+
+            hit = self._exact.get(query)
+            if hit is not None:
+                logger.debug("Semantic cache: exact hit")
+                return hit[0]
+
+            representation = self._represent(query)
+
+            if self._use_faiss:
+                index = self._ensure_index()
+                if index is None:
+                    return None
+                query_vec = np.asarray(representation, dtype=np.float32).reshape(1, -1)
+                faiss.normalize_L2(query_vec)
+                scores, ids = index.search(query_vec, 1)
+                if scores[0, 0] >= self.similarity_threshold:
+                    logger.debug("Semantic cache: similarity hit (%.2f)", scores[0, 0])
+                    return self._entries[ids[0, 0]][2]
+                return None
+
+            best_value = None
+            best_score = self.similarity_threshold
+            for entry_repr, _, value, _ in self._entries:
+                score = self._similarity(representation, entry_repr)
+                if score >= best_score:
+                    best_score = score
+                    best_value = value
+            if best_value is not None:
+                logger.debug("Semantic cache: similarity hit (%.2f)", best_score)
+            return best_value
+
+    def set(self, query, value):
+        """Caches a response for the given query."""
+        now = time()
+        with self._lock:
+            self._evict_expired(now)
+            if len(self._entries) >= self.max_entries:
+                _, old_key, _, _ = self._entries.pop(0)
+                self._exact.pop(old_key, None)
+                self._index_stale = True
+            self._exact[query] = (value, now)
+            representation = self._represent(query)
+            self._entries.append((representation, query, value, now))
+            if self._use_faiss and self._index is not None and not self._index_stale:
+                vec = np.asarray(representation, dtype=np.float32).reshape(1, -1)
+                faiss.normalize_L2(vec)
+                self._index.add(vec)
+
+    def clear(self):
+        """Drops all cached entries."""
+        with self._lock:
+            self._exact.clear()
+            self._entries.clear()
+            self._index = None
+            self._index_stale = False
+
+    def _ensure_index(self):
+        """Returns the FAISS index over current entries, rebuilding if stale.
+
+        Caller must hold the lock. IndexFlatIP has no cheap deletion, so
+        evictions mark the index stale and the next lookup rebuilds it.
+        """
+        if self._index is not None and not self._index_stale:
+            return self._index
+        if not self._entries:
+            self._index = None
+            self._index_stale = False
+            return None
+        vectors = np.asarray([entry[0] for entry in self._entries], dtype=np.float32)
+        faiss.normalize_L2(vectors)
+        # 8-bit scalar quantization: a quarter of the FP32 footprint and an
+        # int8 dot-product kernel, at negligible recall loss for cosine.
+        index = faiss.IndexScalarQuantizer(
+            vectors.shape[1], faiss.ScalarQuantizer.QT_8bit, faiss.METRIC_INNER_PRODUCT
+        )
+        index.train(vectors)
+        index.add(vectors)
+        self._index = index
+        self._index_stale = False
+        return index
+
+    def _evict_expired(self, now):
+        cutoff = now - self.max_age
+        if self._entries and self._entries[0][3] < cutoff:
+            self._entries = [e for e in self._entries if e[3] >= cutoff]
+            self._exact = {k: v for k, v in self._exact.items() if v[1] >= cutoff}
+            self._index_stale = True
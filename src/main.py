@@ -8,7 +8,6 @@ from pathlib import Path
 from typing import Any
 
 from src.config import load_config
-from src.modules import person_lookup, username_search
 from src.utils.logger import get_logger
 from src.utils.output_saver import SUPPORTED_OUTPUT_FORMATS, save_results
 
@@ -39,22 +38,62 @@ def _add_output_arguments(parser: argparse.ArgumentParser) -> None:
     )
 
 
-def parse_arguments() -> argparse.Namespace:
-    parser = argparse.ArgumentParser(description="Kallisto-OSINTer: LLM-based OSINT tool")
-    subparsers = parser.add_subparsers(dest="command", required=True)
-
+def _add_person_lookup_parser(subparsers: argparse._SubParsersAction) -> None:
     lookup_parser = subparsers.add_parser("person_lookup", help="Lookup a person")
     lookup_parser.add_argument("name", type=str, help="Name of the person to lookup")
     lookup_parser.add_argument("--ask", type=str, required=True, help="Task to perform on the person info")
     lookup_parser.add_argument("--location", type=str, help="Location to disambiguate person (e.g., 'San Francisco, CA')")
     _add_output_arguments(lookup_parser)
 
+
+def _add_username_search_parser(subparsers: argparse._SubParsersAction) -> None:
     uname_parser = subparsers.add_parser("username_search", help="Search for a username across URLs")
     uname_parser.add_argument("username", type=str, help="Username to search")
     uname_parser.add_argument("--urls", type=str, nargs='+', required=True, help="List of URLs to search in")
     _add_output_arguments(uname_parser)
 
-    return parser.parse_args()
+
+_SUBPARSER_BUILDERS = {
+    "person_lookup": _add_person_lookup_parser,
+    "username_search": _add_username_search_parser,
+}
+
+
+def _build_parser(commands: tuple[str, ...]) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Kallisto-OSINTer: LLM-based OSINT tool")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    for command in commands:
+        _SUBPARSER_BUILDERS[command](subparsers)
+    return parser
+
+
+# Parsers memoized per command set: a CLI run builds one, but tests and
+# embedders calling parse_arguments repeatedly would otherwise rebuild
+# the parser graph every time.
+_parsers: dict[tuple[str, ...], argparse.ArgumentParser] = {}
+
+
+def _get_parser(commands: tuple[str, ...]) -> argparse.ArgumentParser:
+    parser = _parsers.get(commands)
+    if parser is None:
+        parser = _build_parser(commands)
+        _parsers[commands] = parser
+    return parser
+
+
+def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
+    if argv is None:
+        argv = sys.argv[1:]
+    # Only the invoked command's subparser is constructed; add_parser is
+    # the expensive part of argparse startup and one invocation only ever
+    # runs one command. --help and error paths build the full set so the
+    # usage text stays complete.
+    first = argv[0] if argv else None
+    if first in _SUBPARSER_BUILDERS:
+        parser = _get_parser((first,))
+    else:
+        parser = _get_parser(tuple(_SUBPARSER_BUILDERS))
+    return parser.parse_args(argv)
 
 
 def _resolve_output_format(path: str, explicit_format: str | None) -> str:
@@ -80,12 +119,19 @@ def main() -> None:
     config = load_config()
     args = parse_arguments()
 
+    # The command modules transitively import the LLM clients, requests,
+    # tenacity, etc., so they load only after argparse has dispatched;
+    # --help and usage errors pay argparse cost alone.
     if args.command == "person_lookup":
+        from src.modules import person_lookup
+
         logger.info("Starting person lookup for %s", args.name)
         result = person_lookup.lookup_person(args.name, args.ask, config, location=args.location)
         print(result)
         _maybe_save_results(result, args.output, args.output_format)
     elif args.command == "username_search":
+        from src.modules import username_search
+
         logger.info("Starting username search for %s", args.username)
         results = username_search.search_username(args.username, args.urls, config)
         for res in results:
@@ -3,12 +3,71 @@ DNS Lookup module.
 Provides functions to perform DNS lookups using dnspython.
 """
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
 import dns.resolver
 from dns import exception as dns_exception
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# One resolver instance shared across calls instead of the module-level
+# default: its LRU cache short-circuits repeat queries at the library
+# layer (honoring record TTLs) and avoids per-call resolver bookkeeping.
+_RESOLVER = dns.resolver.Resolver()
+_RESOLVER.cache = dns.resolver.LRUCache(max_size=10_000)
+_RESOLVER.lifetime = 5.0
+
+# In-process TTL cache keyed on (domain, record type), shared with
+# ip_lookup. Repeat queries for the same name during an OSINT run skip the
+# recursive-resolver round trip (~20-100ms each). Entries honor the
+# answer's RRset TTL capped at 5 minutes; failed lookups are cached
+# briefly so NXDOMAIN names aren't re-queried on every call.
+_CACHE_MAX_TTL = 300
+_CACHE_NEGATIVE_TTL = 30
+_dns_cache = {}
+_dns_cache_lock = threading.Lock()
+
+
+def _cache_get(domain, rtype):
+    """Returns the cached record list for (domain, rtype), or None on miss."""
+    with _dns_cache_lock:
+        entry = _dns_cache.get((domain, rtype))
+        if entry is not None and time.monotonic() < entry[0]:
+            return entry[1]
+    return None
+
+
+def _cache_set(domain, rtype, records, ttl):
+    with _dns_cache_lock:
+        _dns_cache[(domain, rtype)] = (time.monotonic() + ttl, records)
+
+
+def _resolve_cached(domain, rtype):
+    """
+    Resolves (domain, rtype) through the TTL cache.
+    Returns a list of record strings; failures resolve to an empty,
+    negatively-cached list.
+    """
+    cached = _cache_get(domain, rtype)
+    if cached is not None:
+        return list(cached)
+    try:
+        answers = _RESOLVER.resolve(domain, rtype)
+        records = [r.to_text() for r in answers]
+        ttl = min(getattr(answers.rrset, "ttl", _CACHE_MAX_TTL), _CACHE_MAX_TTL)
+        _cache_set(domain, rtype, records, ttl)
+        logger.info("DNS %s records for %s: %s", rtype, domain, records)
+        return records
+    except dns_exception.DNSException as e:
+        logger.error("DNS lookup for %s record on %s failed: %s", rtype, domain, str(e))
+        _cache_set(domain, rtype, [], _CACHE_NEGATIVE_TTL)
+        return []
+
+
 def lookup_dns(domain, record_types=None):
     """
     Performs DNS lookup for a domain for specified record types.
@@ -17,14 +76,13 @@ def lookup_dns(domain, record_types=None):
     """
     if record_types is None:
         record_types = ['A', 'MX', 'NS', 'TXT']
-    
-    records = {}
-    for rtype in record_types:
-        try:
-            answers = dns.resolver.resolve(domain, rtype)
-            records[rtype] = [r.to_text() for r in answers]
-            logger.info("DNS %s records for %s: %s", rtype, domain, records[rtype])
-        except dns_exception.DNSException as e:
-            logger.error("DNS lookup for %s record on %s failed: %s", rtype, domain, str(e))
-            records[rtype] = []
-    return records
\ No newline at end of file
+
+    if len(record_types) == 1:
+        return {record_types[0]: _resolve_cached(domain, record_types[0])}
+
+    # Each record type is an independent query, so they resolve
+    # concurrently: one DNS round trip of wall-clock time instead of one
+    # per type. Per-type failures are handled inside _resolve_cached.
+    with ThreadPoolExecutor(max_workers=len(record_types)) as executor:
+        results = executor.map(partial(_resolve_cached, domain), record_types)
+        return dict(zip(record_types, results))
@@ -7,14 +7,10 @@ def apply_google_filters(query, country=None, language=None, date_range=None):
     """
     Modifies the query to include Google filter parameters.
     """
-    filters = []
-    if country:
-        filters.append(f"site:{country}")
-    if language:
-        filters.append(f"lang:{language}")
-    if date_range:
-        filters.append(f"daterange:{date_range}")
-    if filters:
-        filtered_query = f"{query} {' '.join(filters)}"
-        return filtered_query
-    return query
\ No newline at end of file
+    parts = (
+        f"site:{country}" if country else None,
+        f"lang:{language}" if language else None,
+        f"daterange:{date_range}" if date_range else None,
+    )
+    extras = " ".join(part for part in parts if part)
+    return f"{query} {extras}" if extras else query
\ No newline at end of file
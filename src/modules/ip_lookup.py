@@ -3,8 +3,10 @@ IP Lookup module.
 Provides functions to perform IP address lookup using ipwhois and DNS records using dnspython.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 from ipwhois import IPWhois
-from dns import resolver, exception as dns_exception
+from src.modules.dns_lookup import _resolve_cached
 from src.utils.logger import get_logger
 from tenacity import retry, stop_after_attempt, wait_fixed
 
@@ -25,35 +27,57 @@ def lookup_ip(ip_address):
         logger.error("IP lookup failed for %s: %s", ip_address, str(e))
         raise
 
+def lookup_ips(ip_addresses, max_workers=8):
+    """
+    Batched variant of lookup_ip for bulk analysis.
+    Deduplicates the input and runs the RDAP lookups concurrently — they
+    are wait-dominated network calls against the RIR endpoints.
+    Returns a dict mapping each address to its result, or None where the
+    lookup failed after retries.
+    """
+    unique = list(dict.fromkeys(ip_addresses))
+    if not unique:
+        return {}
+    results = {}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(unique))) as executor:
+        futures = {ip: executor.submit(lookup_ip, ip) for ip in unique}
+        for ip, future in futures.items():
+            try:
+                results[ip] = future.result()
+            except Exception as e:
+                logger.error("Batched IP lookup failed for %s: %s", ip, str(e))
+                results[ip] = None
+    return results
+
 def get_dns_records(domain, record_type="A"):
     """
     Retrieves DNS records for the given domain.
     Supported record types: A, MX, NS, TXT, etc.
-    Returns a list of records.
+    Returns a list of records; results come from the TTL cache shared
+    with dns_lookup when the name was queried recently.
     """
-    try:
-        answers = resolver.resolve(domain, record_type)
-        records = [r.to_text() for r in answers]
-        logger.info("DNS records retrieved for %s (%s): %s", domain, record_type, records)
-        return records
-    except dns_exception.DNSException as e:
-        logger.error("DNS lookup failed for %s: %s", domain, str(e))
-        return []
+    return _resolve_cached(domain, record_type)
 
 def comprehensive_ip_analysis(ip_address, domain=None):
     """
     Performs comprehensive analysis including IP lookup and DNS records if domain is provided.
     Returns a combined dictionary of results.
     """
-    ip_info = lookup_ip(ip_address)
-    dns_info = {}
-    if domain:
-        dns_info = {
-            "A": get_dns_records(domain, "A"),
-            "MX": get_dns_records(domain, "MX"),
-            "NS": get_dns_records(domain, "NS"),
-            "TXT": get_dns_records(domain, "TXT")
+    if not domain:
+        return {"ip_info": lookup_ip(ip_address), "dns_info": {}}
+
+    # The RDAP lookup and the four record-type queries have no data
+    # dependency, so they run concurrently: total latency is the slowest
+    # single lookup instead of the sum of five network round trips.
+    record_types = ["A", "MX", "NS", "TXT"]
+    with ThreadPoolExecutor(max_workers=1 + len(record_types)) as executor:
+        ip_future = executor.submit(lookup_ip, ip_address)
+        dns_futures = {
+            rtype: executor.submit(get_dns_records, domain, rtype)
+            for rtype in record_types
         }
+        dns_info = {rtype: future.result() for rtype, future in dns_futures.items()}
+        ip_info = ip_future.result()
     combined = {
         "ip_info": ip_info,
         "dns_info": dns_info
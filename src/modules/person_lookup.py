@@ -7,10 +7,20 @@ information and then answers the question.
 from __future__ import annotations
 
 from src.agents.knowledge_agent import KnowledgeAgent
+from src.llm.semantic_cache import SemanticCache
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Near-duplicate lookups (same person, lightly reworded question) reuse the
+# previous answer instead of re-running the full search + LLM pipeline.
+_answer_cache = SemanticCache(similarity_threshold=0.9, max_age=3600)
+
+# Static instruction prefix kept byte-identical across calls so provider-side
+# prompt-prefix caching can reuse its tokens; the variable subject (name and
+# optional location) is always appended after it.
+_QUERY_PREFIX = "Learn as much as you can about"
+
 
 def lookup_person(name: str, question: str, config: dict, location: str | None = None) -> str:
     """Return an answer about ``name`` based on the supplied ``question``."""
@@ -19,12 +29,21 @@ def lookup_person(name: str, question: str, config: dict, location: str | None =
 
     # Add location to query if provided for disambiguation
     if location:
-        query = f"Learn as much as you can about {name} from {location}"
+        query = f"{_QUERY_PREFIX} {name} from {location}"
         logger.info("Using location for disambiguation: %s", location)
     else:
-        query = f"Learn as much as you can about {name}"
+        query = f"{_QUERY_PREFIX} {name}"
+
+    # Key on normalized inputs so trivial variations ("John Doe " vs
+    # "john doe") land on the same cache entry.
+    cache_key = f"{query.strip().lower()}\n{question.strip().lower()}"
+    cached_answer = _answer_cache.get(cache_key)
+    if cached_answer is not None:
+        logger.info("Returning cached answer for: %s", name)
+        return cached_answer
 
     knowledge_agent = KnowledgeAgent(query, config, rounds=2)
     knowledge_agent.aggregate_knowledge()
     answer = knowledge_agent.answer_final_question(question)
+    _answer_cache.set(cache_key, answer)
     return answer
@@ -1,47 +1,186 @@
 """Username Search module.
 
-Searches a list of URLs concurrently for a specified username. Utilises
-threading, proxies, and randomized user agents.
+Searches a list of URLs concurrently for a specified username. Probes run
+as coroutines on one aiohttp session with a shared connection pool;
+threading with proxies and randomized user agents remains as a fallback.
 """
 
 from __future__ import annotations
 
-import random
+import asyncio
+import hashlib
+import itertools
+import re
+import threading
+import time
 from concurrent.futures import ThreadPoolExecutor
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from src.utils.cache import Cache
 from src.utils.logger import get_logger
 from src.utils.proxies import validate_proxies
 from src.utils.user_agents import get_random_user_agent
 
 logger = get_logger(__name__)
 
+# Platform presence rarely changes minute to minute; repeat checks of the
+# same username against the same URL set are served from cache. The Cache
+# is built on first use - constructing it creates its directory on disk,
+# which an import (src.modules pulls this module in eagerly) shouldn't do.
+_RESULT_MAX_AGE = 1800  # seconds
+_result_cache = None
+_result_cache_lock = threading.Lock()
+
+
+def _get_result_cache() -> Cache:
+    global _result_cache
+    if _result_cache is None:
+        with _result_cache_lock:
+            if _result_cache is None:
+                _result_cache = Cache()
+    return _result_cache
+
+# Proxy health rarely flips between back-to-back queries, and validating
+# re-probes every proxy over the network; results are reused for a while.
+_PROXY_VALIDATION_MAX_AGE = 300  # seconds
+_proxy_validation_lock = threading.Lock()
+_proxy_validation_cache: Dict[Tuple[str, ...], Tuple[float, List[str]]] = {}
+
+
+def _cached_validate_proxies(proxy_list: List[str]) -> List[str]:
+    """Returns the validated subset of ``proxy_list``, memoized with a TTL."""
+    key = tuple(proxy_list)
+    now = time.monotonic()
+    with _proxy_validation_lock:
+        entry = _proxy_validation_cache.get(key)
+        if entry is not None and now < entry[0]:
+            return list(entry[1])
+    valid = validate_proxies(proxy_list)
+    with _proxy_validation_lock:
+        _proxy_validation_cache[key] = (now + _PROXY_VALIDATION_MAX_AGE, valid)
+    return valid
+
+
+def _cache_key(username: str, urls: List[str]) -> str:
+    digest = hashlib.sha256("\x1f".join(sorted(urls)).encode("utf-8")).hexdigest()[:16]
+    return f"username_search_{username.strip().lower()}_{digest}"
+
 
 def search_username(username: str, urls: List[str], config: dict) -> List[Dict[str, str]]:
     """Check each URL for ``username`` and return discovery metadata."""
 
-    proxy_list = config.get("PROXY_LIST", [])
-    valid_proxies = validate_proxies(proxy_list) if proxy_list else []
-    max_workers_config = int(config.get("USERNAME_SEARCH_MAX_WORKERS", 10))
-    worker_count = max(1, min(max_workers_config, len(urls) or 1))
+    if not urls:
+        return []
+
+    cache_key = _cache_key(username, urls)
+    cached = _get_result_cache().get(cache_key, max_age=_RESULT_MAX_AGE)
+    if cached is not None:
+        logger.info("Returning cached username results for: %s", username)
+        return cached
+
+    # Preferred path: run the probes on one aiohttp session — a single
+    # connection pool with TCP/TLS keep-alive across all URLs instead of a
+    # kernel thread and fresh handshake per URL. Threads remain the
+    # fallback when this thread already hosts an event loop (asyncio.run
+    # would raise); such callers should use search_username_async directly.
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        results = asyncio.run(search_username_async(username, urls, config))
+    else:
+        proxy_list = config.get("PROXY_LIST", [])
+        valid_proxies = _cached_validate_proxies(proxy_list) if proxy_list else []
+        max_workers_config = int(config.get("USERNAME_SEARCH_MAX_WORKERS", 10))
+        worker_count = max(1, min(max_workers_config, len(urls) or 1))
+        results = _search_threaded(username, urls, valid_proxies, worker_count)
+
+    # Only cache clean runs - errored fetches should retry next call
+    if not any(r["status"].startswith("error") for r in results):
+        _get_result_cache().set(cache_key, results)
+    return results
+
+
+def _search_threaded(
+    username: str,
+    urls: List[str],
+    valid_proxies: List[str],
+    worker_count: int,
+) -> List[Dict[str, str]]:
+    """Thread-per-probe fallback using requests, preserving input order."""
+
+    # One pooled session shared by all workers: TCP connections and TLS
+    # sessions are reused across probes that hit common hosts instead of
+    # paying a fresh handshake per URL.
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=worker_count,
+        pool_maxsize=worker_count * 2,
+        max_retries=Retry(total=3, backoff_factor=0.3),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    # Compiled once per search and matched against the raw response bytes:
+    # skips decoding the body and the full lowercase copies that
+    # content.lower() would allocate per page.
+    pattern = re.compile(re.escape(username).encode(), re.IGNORECASE)
+
+    # Round-robin instead of random.choice: next() on a cycle is a C-level
+    # pointer advance (atomic under the GIL) and spreads load evenly
+    # across proxies rather than clumping.
+    proxy_iter = itertools.cycle(valid_proxies) if valid_proxies else None
 
     def worker(url: str) -> Dict[str, str]:
         headers = {"User-Agent": get_random_user_agent()}
-        proxy_address = random.choice(valid_proxies) if valid_proxies else None
+        proxy_address = next(proxy_iter) if proxy_iter is not None else None
         proxy = {"http": proxy_address, "https": proxy_address} if proxy_address else None
         try:
-            response = requests.get(url, headers=headers, proxies=proxy, timeout=10)
-            content = response.text
-            found = username.lower() in content.lower()
+            response = session.get(url, headers=headers, proxies=proxy, timeout=10)
+            found = pattern.search(response.content) is not None
             status = "found" if found else "not found"
         except Exception as exc:  # pragma: no cover - network/requests failures
             status = f"error: {exc}"
         return {"url": url, "status": status}
 
+    try:
+        with ThreadPoolExecutor(max_workers=worker_count) as executor:
+            return list(executor.map(worker, urls))
+    finally:
+        session.close()
+
+
+async def search_username_async(username: str, urls: List[str], config: dict) -> List[Dict[str, str]]:
+    """Async variant of :func:`search_username` using the shared aiohttp scraper.
+
+    All platform checks run as coroutines on one event loop with a single
+    connection-pooled session, instead of one thread (and one connection)
+    per URL.
+    """
+
     if not urls:
         return []
 
-    with ThreadPoolExecutor(max_workers=worker_count) as executor:
-        return list(executor.map(worker, urls))
+    from src.async_web.async_scraper import fetch_all
+
+    proxy_list = config.get("PROXY_LIST", [])
+    valid_proxies = _cached_validate_proxies(proxy_list) if proxy_list else None
+    max_workers_config = int(config.get("USERNAME_SEARCH_MAX_WORKERS", 10))
+    max_concurrent = max(1, min(max_workers_config, len(urls)))
+
+    fetched = await fetch_all(urls, valid_proxies, max_concurrent=max_concurrent)
+
+    # fetch_all returns decoded text, so match with a compiled
+    # case-insensitive pattern instead of lowercasing every page.
+    pattern = re.compile(re.escape(username), re.IGNORECASE)
+    results = []
+    for item in fetched:
+        if item["status"] == "error":
+            status = "error: fetch failed"
+        else:
+            status = "found" if pattern.search(item["content"]) else "not found"
+        results.append({"url": item["url"], "status": status})
+    return results
@@ -0,0 +1,85 @@
+"""Unit tests for the Guardr API Flask endpoints."""
+
+from __future__ import annotations
+
+import unittest
+from unittest.mock import patch
+
+import guardr_api
+
+
+class TestCheckProfileBatch(unittest.TestCase):
+    def setUp(self) -> None:
+        guardr_api.app.config["TESTING"] = True
+        self.client = guardr_api.app.test_client()
+
+    def test_batch_checks_profiles_in_order(self) -> None:
+        profiles = [{"username": "alice"}, {"username": "bob"}]
+        with patch.object(
+            guardr_api,
+            "run_profile_check",
+            side_effect=lambda email, name, location, username: {"checked": username},
+        ):
+            response = self.client.post("/api/check-batch", json={"profiles": profiles})
+        self.assertEqual(response.status_code, 200)
+        payload = response.get_json()
+        self.assertEqual(payload["count"], 2)
+        self.assertEqual(payload["results"], [{"checked": "alice"}, {"checked": "bob"}])
+
+    def test_malformed_element_yields_element_error_not_500(self) -> None:
+        profiles = [
+            {"username": "alice"},
+            "not-a-dict",
+            {"name": 42},
+            {"username": "bob"},
+        ]
+        with patch.object(
+            guardr_api,
+            "run_profile_check",
+            side_effect=lambda email, name, location, username: {"checked": username},
+        ):
+            response = self.client.post("/api/check-batch", json={"profiles": profiles})
+        self.assertEqual(response.status_code, 200)
+        results = response.get_json()["results"]
+        self.assertEqual(len(results), 4)
+        self.assertEqual(results[0], {"checked": "alice"})
+        self.assertIn("error", results[1])
+        self.assertIn("error", results[2])
+        self.assertEqual(results[3], {"checked": "bob"})
+
+    def test_empty_profile_yields_element_error(self) -> None:
+        response = self.client.post("/api/check-batch", json={"profiles": [{}]})
+        self.assertEqual(response.status_code, 200)
+        results = response.get_json()["results"]
+        self.assertIn("error", results[0])
+
+
+class TestCheckCache(unittest.TestCase):
+    def setUp(self) -> None:
+        guardr_api._check_cache.clear()
+
+    def tearDown(self) -> None:
+        guardr_api._check_cache.clear()
+
+    def test_errored_results_are_not_cached(self) -> None:
+        result = {
+            "person_verification": "Person lookup error: provider down",
+            "username_verification": None,
+        }
+        guardr_api._store_cached_check("fp1", result)
+        self.assertIsNone(guardr_api._get_cached_check("fp1"))
+
+    def test_cache_is_bounded(self) -> None:
+        clean = {"person_verification": "ok", "username_verification": None}
+        for index in range(guardr_api.CHECK_CACHE_MAX_ENTRIES + 10):
+            guardr_api._store_cached_check(f"fp{index}", clean)
+        self.assertLessEqual(
+            len(guardr_api._check_cache), guardr_api.CHECK_CACHE_MAX_ENTRIES
+        )
+        # The newest entry survives eviction
+        newest = f"fp{guardr_api.CHECK_CACHE_MAX_ENTRIES + 9}"
+        self.assertEqual(guardr_api._get_cached_check(newest), clean)
+
+
+if __name__ == "__main__":
+    unittest.main()
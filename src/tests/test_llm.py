@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import time
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from src.llm.llm_client import LLMClient
 
@@ -139,5 +140,121 @@ class TestLLMClient(unittest.TestCase):
         self.assertEqual(model_arg, "gpt-custom")
 
 
+class _FakeResponseCache:
+    """In-memory stand-in for the disk-backed response cache."""
+
+    def __init__(self) -> None:
+        self.store: dict = {}
+
+    def get(self, key, max_age=None):
+        return self.store.get(key)
+
+    def set(self, key, value) -> None:
+        self.store[key] = value
+
+
+class TestLLMCircuitBreaker(unittest.TestCase):
+    def setUp(self) -> None:
+        self.llm_client = LLMClient(rate_limit=0)
+
+    def _trip_breaker(self, provider_mock: MagicMock) -> None:
+        for _ in range(LLMClient.CB_THRESHOLD):
+            self.llm_client.call_llm("Test prompt")
+        self.assertEqual(provider_mock.call_count, LLMClient.CB_THRESHOLD)
+
+    def test_circuit_opens_after_threshold_failures(self) -> None:
+        failing_mock = MagicMock(side_effect=Exception("outage"))
+        self.llm_client._providers = [("openai", failing_mock)]
+        self._trip_breaker(failing_mock)
+        response = self.llm_client.call_llm("Test prompt")
+        # The open circuit skips the provider instead of calling it again
+        self.assertEqual(failing_mock.call_count, LLMClient.CB_THRESHOLD)
+        self.assertIn("circuit open", response)
+
+    def test_open_circuit_falls_through_to_next_provider(self) -> None:
+        failing_mock = MagicMock(side_effect=Exception("outage"))
+        anthropic_mock = MagicMock(return_value="Anthropic response")
+        self.llm_client._providers = [
+            ("openai", failing_mock),
+            ("anthropic", anthropic_mock),
+        ]
+        self._trip_breaker(failing_mock)
+        failing_mock.reset_mock()
+        response = self.llm_client.call_llm("Test prompt")
+        self.assertEqual(response, "Anthropic response")
+        failing_mock.assert_not_called()
+
+    def test_half_open_probe_closes_circuit_on_success(self) -> None:
+        provider_mock = MagicMock(side_effect=Exception("outage"))
+        self.llm_client._providers = [("openai", provider_mock)]
+        self._trip_breaker(provider_mock)
+        self.assertTrue(self.llm_client._circuit_open("openai"))
+        # Rewind the opening timestamp past the cooldown so a probe is allowed
+        self.llm_client._cb_opened_at["openai"] = (
+            time.monotonic() - LLMClient.CB_COOLDOWN - 1
+        )
+        provider_mock.side_effect = None
+        provider_mock.return_value = "recovered"
+        response = self.llm_client.call_llm("Test prompt")
+        self.assertEqual(response, "recovered")
+        self.assertFalse(self.llm_client._circuit_open("openai"))
+        self.assertNotIn("openai", self.llm_client._cb_failures)
+
+    def test_failed_probe_reopens_circuit_immediately(self) -> None:
+        failing_mock = MagicMock(side_effect=Exception("outage"))
+        self.llm_client._providers = [("openai", failing_mock)]
+        self._trip_breaker(failing_mock)
+        self.llm_client._cb_opened_at["openai"] = (
+            time.monotonic() - LLMClient.CB_COOLDOWN - 1
+        )
+        self.llm_client.call_llm("Test prompt")
+        # One probe call, then the circuit re-opens with a longer cooldown
+        self.assertEqual(failing_mock.call_count, LLMClient.CB_THRESHOLD + 1)
+        self.assertTrue(self.llm_client._circuit_open("openai"))
+        self.assertEqual(self.llm_client._cb_reopens["openai"], 1)
+
+
+class TestLLMResponseCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.llm_client = LLMClient(rate_limit=0)
+        self.fake_cache = _FakeResponseCache()
+
+    def test_deterministic_calls_are_cached(self) -> None:
+        provider_mock = MagicMock(return_value="deterministic answer")
+        self.llm_client._providers = [("openai", provider_mock)]
+        with patch(
+            "src.llm.llm_client._get_response_cache", return_value=self.fake_cache
+        ):
+            first = self.llm_client.call_llm("Test prompt", temperature=0)
+            second = self.llm_client.call_llm("Test prompt", temperature=0)
+        self.assertEqual(first, "deterministic answer")
+        self.assertEqual(second, "deterministic answer")
+        provider_mock.assert_called_once()
+
+    def test_sampled_calls_bypass_cache(self) -> None:
+        provider_mock = MagicMock(return_value="sampled answer")
+        self.llm_client._providers = [("openai", provider_mock)]
+        with patch(
+            "src.llm.llm_client._get_response_cache", return_value=self.fake_cache
+        ):
+            self.llm_client.call_llm("Test prompt", temperature=0.7)
+            self.llm_client.call_llm("Test prompt", temperature=0.7)
+        self.assertEqual(provider_mock.call_count, 2)
+        self.assertEqual(self.fake_cache.store, {})
+
+    def test_failed_deterministic_calls_are_not_cached(self) -> None:
+        provider_mock = MagicMock(side_effect=Exception("outage"))
+        self.llm_client._providers = [("openai", provider_mock)]
+        with patch(
+            "src.llm.llm_client._get_response_cache", return_value=self.fake_cache
+        ):
+            response = self.llm_client.call_llm("Test prompt", temperature=0)
+            self.llm_client.call_llm("Test prompt", temperature=0)
+        self.assertIn("LLM Error", response)
+        self.assertEqual(self.fake_cache.store, {})
+        # The error was not served from cache; the provider was retried
+        self.assertEqual(provider_mock.call_count, 2)
+
+
 if __name__ == "__main__":
     unittest.main()
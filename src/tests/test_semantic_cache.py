@@ -0,0 +1,60 @@
+"""Unit tests for the semantic cache."""
+
+from __future__ import annotations
+
+import unittest
+
+from src.llm.semantic_cache import SemanticCache
+
+
+class TestSemanticCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.cache = SemanticCache(similarity_threshold=0.8, max_age=3600)
+
+    def test_exact_match_hit(self) -> None:
+        self.cache.set("Learn about John Doe", "report")
+        self.assertEqual(self.cache.get("Learn about John Doe"), "report")
+
+    def test_similar_query_hit(self) -> None:
+        self.cache.set("Learn as much as you can about John Doe from Austin", "report")
+        result = self.cache.get("Learn as much as you can about John Doe from Austin, TX")
+        self.assertEqual(result, "report")
+
+    def test_dissimilar_query_miss(self) -> None:
+        self.cache.set("Learn as much as you can about John Doe", "report")
+        self.assertIsNone(self.cache.get("Check breach data for jane@example.com"))
+
+    def test_empty_cache_miss(self) -> None:
+        self.assertIsNone(self.cache.get("anything"))
+
+    def test_expired_entries_are_evicted(self) -> None:
+        cache = SemanticCache(max_age=0)
+        cache.set("query", "value")
+        self.assertIsNone(cache.get("query"))
+
+    def test_max_entries_evicts_oldest(self) -> None:
+        cache = SemanticCache(similarity_threshold=1.1, max_entries=2)
+        cache.set("first unique query", "one")
+        cache.set("second unique query", "two")
+        cache.set("third unique query", "three")
+        self.assertIsNone(cache.get("first unique query"))
+        self.assertEqual(cache.get("third unique query"), "three")
+
+    def test_clear(self) -> None:
+        self.cache.set("query", "value")
+        self.cache.clear()
+        self.assertIsNone(self.cache.get("query"))
+
+    def test_custom_embedder_similarity(self) -> None:
+        # Toy embedder: identical first word -> identical unit vector
+        def embed(text: str) -> tuple[float, float]:
+            return (1.0, 0.0) if text.split()[0] == "alpha" else (0.0, 1.0)
+
+        cache = SemanticCache(similarity_threshold=0.9, embedder=embed)
+        cache.set("alpha one", "cached")
+        self.assertEqual(cache.get("alpha two"), "cached")
+        self.assertIsNone(cache.get("beta one"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,11 +4,18 @@ Splits HTML content into manageable chunks and uses the LLM client to summarize
 """
 
 import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
 from bs4 import BeautifulSoup
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Bounded pool for the map phase; the LLM client's own rate limiter still
+# spaces out the underlying provider calls.
+MAX_MAP_WORKERS = 4
+
 def clean_html(html_content):
     """
     Uses BeautifulSoup to strip HTML tags and returns plain text.
@@ -52,7 +59,7 @@ def map_reduce(html_content, llm_client):
     Performs the map-reduce:
       1. Clean HTML to text.
       2. Split text into chunks.
-      3. Summarize each chunk (with rate limiting).
+      3. Summarize chunks in parallel (with rate limiting).
       4. Concatenate summaries.
     """
     logger.info("Starting map-reduce summarization.")
@@ -66,11 +73,14 @@ def map_reduce(html_content, llm_client):
     chunks = split_text(text)
     logger.debug("Split content into %d chunks", len(chunks))
 
-    summaries = []
-    for i, chunk in enumerate(chunks):
-        logger.debug("Summarizing chunk %d/%d", i+1, len(chunks))
-        summary = summarize_chunk(chunk, llm_client)
-        summaries.append(summary)
+    if len(chunks) == 1:
+        summaries = [summarize_chunk(chunks[0], llm_client)]
+    else:
+        # Map phase fans out across a bounded pool; executor.map keeps the
+        # summaries in chunk order for the reduce step.
+        max_workers = min(MAX_MAP_WORKERS, len(chunks))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            summaries = list(executor.map(partial(summarize_chunk, llm_client=llm_client), chunks))
 
     final_summary = "\n".join(summaries)
     return final_summary
\ No newline at end of file
@@ -4,7 +4,7 @@ Fetches the raw HTML content from a given URL using multiple scraping services.
 Supports ScrapingBee, ScrapingDog, Firecrawl, and direct requests as fallback.
 """
 
-import requests
+from src.utils.http import get_session
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -14,7 +14,7 @@ def _try_firecrawl(url, api_key):
     try:
         headers = {"Authorization": f"Bearer {api_key}"}
         data = {"url": url}
-        response = requests.post("https://api.firecrawl.dev/v0/scrape",
+        response = get_session().post("https://api.firecrawl.dev/v0/scrape",
                                 json=data, headers=headers, timeout=15)
         if response.status_code == 200:
             result = response.json()
@@ -27,7 +27,7 @@ def _try_scrapingdog(url, api_key):
     """Try fetching URL using ScrapingDog API."""
     try:
         params = {"api_key": api_key, "url": url, "dynamic": "true"}
-        response = requests.get("https://api.scrapingdog.com/scrape",
+        response = get_session().get("https://api.scrapingdog.com/scrape",
                               params=params, timeout=15)
         if response.status_code == 200:
             return response.text
@@ -39,7 +39,7 @@ def _try_scrapingbee(url, api_key):
     """Try fetching URL using ScrapingBee API."""
     try:
         params = {"api_key": api_key, "url": url, "render_js": "true"}
-        response = requests.get("https://app.scrapingbee.com/api/v1/",
+        response = get_session().get("https://app.scrapingbee.com/api/v1/",
                               params=params, timeout=15)
         if response.status_code == 200:
             return response.text
@@ -81,7 +81,7 @@ def read_url(url, config):
             'User-Agent': config.get('DEFAULT_USER_AGENT',
                 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
         }
-        response = requests.get(url, headers=headers, timeout=15)
+        response = get_session().get(url, headers=headers, timeout=15)
         if response.status_code == 200:
             return response.text
         logger.warning("Direct request failed with status %d for %s",
@@ -3,8 +3,8 @@ Search tool module.
 Uses the Serper API (or similar) to perform Google searches with optional filtering.
 """
 
-import requests
 import time
+from src.utils.http import get_session
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -50,7 +50,7 @@ def search_query(query, config, country=None, language=None, date_range=None):
 
     logger.debug("Sending search query: %s", payload)
     try:
-        response = requests.post(url, json=payload, headers=headers, timeout=10)
+        response = get_session().post(url, json=payload, headers=headers, timeout=10)
         _last_search_time = time.time()
         if response.status_code == 200:
             data = response.json()
@@ -0,0 +1,34 @@
+"""
+Shared HTTP session utilities.
+Provides a process-wide requests.Session with connection pooling so outbound
+calls reuse keep-alive connections instead of performing a TCP + TLS
+handshake per request.
+"""
+
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session(pool_connections=20, pool_maxsize=20):
+    """
+    Returns the process-wide pooled session, creating it on first use.
+    requests.Session is thread-safe for concurrent requests.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=pool_connections,
+                    pool_maxsize=pool_maxsize,
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _session = session
+    return _session
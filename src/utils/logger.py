@@ -1,9 +1,24 @@
 """Logger setup for Kallisto-OSINTer."""
 
+import atexit
 import logging
 import os
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
 from typing import Optional
 
+_FORMATTER = logging.Formatter(
+    "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+
+# Shared console pipeline: loggers enqueue records (cheap, non-blocking) and
+# a single background QueueListener thread does the actual stream I/O, so
+# request/agent threads never stall on a slow or contended stderr write.
+_console_queue: SimpleQueue = SimpleQueue()
+_console_listener: Optional[QueueListener] = None
+_listener_lock = threading.Lock()
+
 
 def _env_to_bool(value: Optional[str]) -> bool:
     if value is None:
@@ -25,8 +40,24 @@ def _resolve_level(level: Optional[int]) -> int:
     return logging.INFO
 
 
+def _ensure_console_listener() -> None:
+    global _console_listener
+    if _console_listener is not None:
+        return
+    with _listener_lock:
+        if _console_listener is None:
+            console_handler = logging.StreamHandler()
+            console_handler.setFormatter(_FORMATTER)
+            listener = QueueListener(
+                _console_queue, console_handler, respect_handler_level=False
+            )
+            listener.start()
+            atexit.register(listener.stop)
+            _console_listener = listener
+
+
 def get_logger(name: str, log_file: Optional[str] = None, level: Optional[int] = None) -> logging.Logger:
-    """Configure and return a logger."""
+    """Configure and return a logger with queue-based, off-thread emission."""
 
     logger = logging.getLogger(name)
 
@@ -34,19 +65,22 @@ def get_logger(name: str, log_file: Optional[str] = None, level: Optional[int] =
     logger.setLevel(resolved_level)
 
     if not logger.handlers:
-        formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-        )
-
-        console_handler = logging.StreamHandler()
-        console_handler.setFormatter(formatter)
-        console_handler.setLevel(resolved_level)
-        logger.addHandler(console_handler)
-
         if log_file:
+            # Dedicated queue/listener so only this logger's records reach
+            # the file handler.
+            file_queue: SimpleQueue = SimpleQueue()
+            console_handler = logging.StreamHandler()
+            console_handler.setFormatter(_FORMATTER)
             file_handler = logging.FileHandler(log_file)
-            file_handler.setFormatter(formatter)
-            file_handler.setLevel(resolved_level)
-            logger.addHandler(file_handler)
+            file_handler.setFormatter(_FORMATTER)
+            listener = QueueListener(
+                file_queue, console_handler, file_handler, respect_handler_level=False
+            )
+            listener.start()
+            atexit.register(listener.stop)
+            logger.addHandler(QueueHandler(file_queue))
+        else:
+            _ensure_console_listener()
+            logger.addHandler(QueueHandler(_console_queue))
 
     return logger